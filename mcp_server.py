@@ -3,16 +3,42 @@
 
 import os
 import re
+import random
+import glob
+import atexit
 from typing import Annotated, Optional, List, Dict, Any, Set
 from datetime import datetime
-from time import time
-from functools import wraps
+from time import time, sleep, monotonic, monotonic_ns, perf_counter_ns, strftime, localtime
+from functools import wraps, lru_cache
 import threading
 import hashlib
-import json
+import pickle
+from bisect import bisect_right
+from itertools import accumulate
+from collections import OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 import pandas as pd
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None  # Optional - dependency name matching falls back to substring scans
+try:
+    from rapidfuzz import fuzz as rf_fuzz, process as rf_process
+except ImportError:
+    rf_process = None  # Optional - game lookups then skip the typo-tolerant fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional - responses are then decoded with the stdlib json parser
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None  # Optional - falls back to chunked pandas CSV parsing and a pickle cache
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 
@@ -20,102 +46,529 @@ from fastmcp import FastMCP
 load_dotenv()
 STEAM_API_KEY = os.getenv('STEAM_API_KEY')
 STEAM_ID = os.getenv('STEAM_ID')
+# Shared read-only params for endpoints that only need the key and your Steam ID
+_AUTH_PARAMS = {'key': STEAM_API_KEY, 'steamid': STEAM_ID}
 
 # Create the server instance
 mcp = FastMCP("simple-steam-mcp")
 
+def _shrink_dtypes(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcast integer columns and categoricalize low-cardinality strings in place
+    
+    The library DataFrame lives for the whole server process, so narrower dtypes
+    cut resident memory and the bytes every filter/groupby has to touch. Float
+    columns stay float64 since they are returned to clients as-is.
+    
+    Args:
+        frame: DataFrame to shrink
+        
+    Returns:
+        The same DataFrame with narrowed dtypes
+    """
+    for col in frame.columns:
+        series = frame[col]
+        kind = series.dtype.kind
+        if kind in 'iu':
+            lowest = series.min()
+            downcast = 'unsigned' if pd.notna(lowest) and lowest >= 0 else 'integer'
+            frame[col] = pd.to_numeric(series, downcast=downcast)
+        elif pd.api.types.is_string_dtype(series.dtype):
+            if series.nunique() / max(len(frame), 1) < 0.5:
+                frame[col] = series.astype('category')
+    return frame
+
 # Load the Steam library data at startup
 # Use absolute path to ensure CSV is found regardless of working directory
 script_dir = os.path.dirname(os.path.abspath(__file__))
 csv_path = os.path.join(script_dir, "steam_library.csv")
-try:
-    df = pd.read_csv(csv_path)
-    # Convert playtime from minutes to hours
-    df['playtime_forever_hours'] = df['playtime_forever'] / 60
-    df['playtime_2weeks_hours'] = df['playtime_2weeks'] / 60
-    # Don't print to stdout as it interferes with STDIO protocol
-    pass
-except Exception as e:
-    # Don't print to stdout as it interferes with STDIO protocol
-    df = pd.DataFrame()  # Empty dataframe as fallback
+
+# Explicit dtypes for the CSV readers and chunk size for the chunked fallback
+CSV_SCHEMA = {
+    'appid': 'uint32',
+    'name': 'string',
+    'playtime_forever': 'uint32',
+    'playtime_2weeks': 'uint32'
+}
+CSV_CHUNKSIZE = 50_000
+
+# Bump when the derived columns change so caches from older code are rebuilt
+LIBRARY_CACHE_VERSION = 3
+
+# Columns matched by search_games
+SEARCH_COLUMNS = ('name', 'genres', 'developers', 'publishers')
+
+# Columns returned by the list-style tools (search/filter)
+SUMMARY_COLUMNS = ['appid', 'name', 'genres', 'review_summary', 'playtime_forever_hours']
+
+def _add_hours_columns(frame: pd.DataFrame) -> pd.DataFrame:
+    """Derive float64 playtime hours columns from the minute counts"""
+    frame['playtime_forever_hours'] = frame['playtime_forever'].astype('float64') / 60
+    frame['playtime_2weeks_hours'] = frame['playtime_2weeks'].astype('float64') / 60
+    return frame
+
+def _add_review_percentage(frame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Derive positive_percentage (share of positive reviews, 0 when there are none)
+    
+    Added after _shrink_dtypes so it stays float64 and matches the per-game division
+    get_game_reviews used to do exactly.
+    """
+    positive = frame['positive_reviews'].to_numpy(dtype=np.float64, na_value=0)
+    total = frame['total_reviews'].to_numpy(dtype=np.float64, na_value=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        frame['positive_percentage'] = np.where(total > 0, positive / total * 100, 0.0)
+    return frame
+
+def _read_csv_arrow() -> pd.DataFrame:
+    """Parse the memory-mapped CSV with pyarrow's multi-threaded reader into Arrow-backed columns"""
+    column_types = {col: pa.type_for_alias(dtype) for col, dtype in CSV_SCHEMA.items()}
+    with pa.memory_map(csv_path) as source:
+        table = pa_csv.read_csv(
+            source,
+            read_options=pa_csv.ReadOptions(use_threads=True, block_size=1 << 20),
+            # Empty fields become nulls, matching pandas' CSV parsing
+            convert_options=pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+        )
+    return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+def _library_cache_path() -> str:
+    """Path of the processed-library cache, keyed on the cache version and the CSV's mtime and size"""
+    stat = os.stat(csv_path)
+    key = hashlib.sha1(f"{LIBRARY_CACHE_VERSION}:{stat.st_mtime}:{stat.st_size}".encode()).hexdigest()[:12]
+    # Arrow IPC when pyarrow is available (memory-mapped on read), pickle otherwise
+    ext = "arrow" if pa is not None else "pkl"
+    return os.path.join(script_dir, f"steam_library.{key}.{ext}")
+
+def _read_library_cache(cache_path: str) -> pd.DataFrame:
+    """Read a processed-library cache written by _write_library_cache"""
+    if cache_path.endswith(".arrow"):
+        # Memory-mapped: every server process reading this file shares the same
+        # page-cache pages, and split_blocks lets numeric columns stay zero-copy views
+        table = pa.ipc.open_file(pa.memory_map(cache_path)).read_all()
+        return table.to_pandas(split_blocks=True)
+    return pd.read_pickle(cache_path)
+
+def _write_library_cache(frame: pd.DataFrame, cache_path: str):
+    """Write the processed library atomically so concurrent readers never see a partial file"""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    if cache_path.endswith(".arrow"):
+        table = pa.Table.from_pandas(frame, preserve_index=False)
+        with pa.OSFile(tmp_path, "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    else:
+        # Protocol 5 writes numpy/Arrow buffers out-of-band instead of re-serializing them
+        frame.to_pickle(tmp_path, protocol=5)
+    os.replace(tmp_path, cache_path)
+
+def _load_library() -> pd.DataFrame:
+    """
+    Load the Steam library DataFrame
+    
+    Reads the processed frame when a cache for the current CSV exists, otherwise
+    parses the CSV, derives the hours columns, shrinks dtypes and writes the cache.
+    
+    Returns:
+        Library DataFrame ready for the tools
+    """
+    cache_path = _library_cache_path()
+    if os.path.exists(cache_path):
+        try:
+            return _read_library_cache(cache_path)
+        except Exception:
+            pass  # Unreadable cache - rebuild from the CSV
+    
+    if pa is not None:
+        frame = _add_hours_columns(_read_csv_arrow())
+    else:
+        # pyarrow not installed - stream the CSV in typed chunks so large int64
+        # buffers are freed before the next chunk and peak memory stays near the final size
+        parts = [
+            _add_hours_columns(chunk)
+            for chunk in pd.read_csv(csv_path, chunksize=CSV_CHUNKSIZE, dtype=CSV_SCHEMA)
+        ]
+        frame = pd.concat(parts, ignore_index=True)
+    frame = _shrink_dtypes(frame)
+    _add_review_percentage(frame)
+    
+    try:
+        # Drop caches for older versions of the CSV before writing the current one
+        for stale_path in glob.glob(os.path.join(script_dir, "steam_library.*.*")):
+            if stale_path != csv_path and stale_path.endswith((".pkl", ".arrow")):
+                os.remove(stale_path)
+        _write_library_cache(frame, cache_path)
+    except Exception:
+        pass  # Cache is only an optimization (read-only dir, ...)
+    return frame
+
+# Library state - filled in by the background loader, read after _wait_for_library()
+df = pd.DataFrame()
+_name_lower = np.array([], dtype=str)  # Lowercased names for vectorized name search
+_search_blob = np.array([], dtype=bytes)  # UTF-8 lowercased name/genres/developers/publishers per game, \x1f-separated
+_playtime_hours = np.array([], dtype=np.float64)  # Plain numpy view of playtime_forever_hours for mask building
+_TOP_PLAYTIME_IDX = np.array([], dtype=np.intp)  # Playtime rankings so top-N queries are slices, not sorts
+_TOP_2W_IDX = np.array([], dtype=np.intp)
+_RECENT_COUNT = 0
+_APPID_ROW: Dict[int, int] = {}  # appid -> first row position
+_NAME_ROW: Dict[str, int] = {}  # lowercased name -> first row position
+HIGHLY_RATED_REVIEWS = ('Overwhelmingly Positive', 'Very Positive')
+_HIGHLY_RATED = np.array([], dtype=bool)  # review_summary in HIGHLY_RATED_REVIEWS, per row
+_GENRE_INDEX: Dict[str, np.ndarray] = {}  # genre -> ascending row positions of games tagged with it
+_LIBRARY_STATS: Dict[str, Any] = {}  # get_library_stats result, computed at load
+_library_ready = threading.Event()
+
+# Category codes for low-cardinality columns: equality filters compare small ints, not strings
+CATEGORY_COLUMNS = ('review_summary', 'maturity_rating', 'genres', 'developers', 'publishers')
+_CAT_CODES: Dict[str, np.ndarray] = {}  # column -> per-row category codes
+_CAT_LOOKUP: Dict[str, Dict[str, np.ndarray]] = {}  # column -> lowercased value -> matching codes
+
+def _playtime_order(frame: pd.DataFrame, column: str) -> np.ndarray:
+    """Row positions sorted by column, highest first (ties keep library order)"""
+    if column not in frame.columns:
+        return np.array([], dtype=np.intp)
+    return np.argsort(-frame[column].to_numpy(dtype=np.int64), kind='stable')
+
+def _build_category_codes(frame: pd.DataFrame):
+    """Capture category codes and lowercase value->code maps for CATEGORY_COLUMNS"""
+    for col in CATEGORY_COLUMNS:
+        if col not in frame.columns or not isinstance(frame[col].dtype, pd.CategoricalDtype):
+            continue
+        codes = frame[col].cat.codes.to_numpy()
+        lookup: Dict[str, list] = {}
+        for code, value in enumerate(frame[col].cat.categories):
+            lookup.setdefault(str(value).lower(), []).append(code)
+        _CAT_CODES[col] = codes
+        _CAT_LOOKUP[col] = {value: np.array(matches, dtype=codes.dtype) for value, matches in lookup.items()}
+
+def _build_genre_index(frame: pd.DataFrame) -> Dict[str, np.ndarray]:
+    """Explode the comma-separated genres once into genre -> row positions"""
+    if 'genres' not in frame.columns:
+        return {}
+    genres = frame['genres'].reset_index(drop=True).dropna().astype(str).str.split(', ').explode().str.strip()
+    return {genre: np.unique(rows.to_numpy(dtype=np.intp))
+            for genre, rows in genres.groupby(genres, sort=False).groups.items()}
+
+def _compute_library_stats(frame: pd.DataFrame) -> Dict[str, Any]:
+    """Overview statistics for the loaded library (backs get_library_stats)"""
+    if frame.empty:
+        return {
+            'total_games': 0,
+            'total_hours_played': 0,
+            'average_hours_per_game': 0,
+            'top_genres': {},
+            'top_developers': {},
+            'review_distribution': {}
+        }
+    
+    # Basic stats
+    total_games = len(frame)
+    total_hours = float(frame['playtime_forever_hours'].sum())
+    avg_hours = total_hours / total_games if total_games > 0 else 0
+    
+    # Genre distribution (split comma-separated genres)
+    genre_counts = frame['genres'].dropna().astype(str).str.split(', ').explode().str.strip().value_counts()
+    top_genres = genre_counts.head(10).to_dict()
+    
+    # Developer distribution
+    dev_counts = frame['developers'].value_counts().head(10).to_dict()
+    
+    # Review distribution
+    review_dist = frame['review_summary'].value_counts().to_dict()
+    
+    return {
+        'total_games': total_games,
+        'total_hours_played': round(total_hours, 2),
+        'average_hours_per_game': round(avg_hours, 2),
+        'top_genres': top_genres,
+        'top_developers': dev_counts,
+        'review_distribution': review_dist
+    }
+
+def _init_library():
+    """Load the library and build its derived indices, then mark it ready"""
+    global df, _name_lower, _search_blob, _playtime_hours, _TOP_PLAYTIME_IDX, _TOP_2W_IDX, _RECENT_COUNT
+    global _APPID_ROW, _NAME_ROW, _HIGHLY_RATED, _GENRE_INDEX, _LIBRARY_STATS
+    try:
+        try:
+            frame = _load_library()
+            # Don't print to stdout as it interferes with STDIO protocol
+        except Exception:
+            # Don't print to stdout as it interferes with STDIO protocol
+            frame = pd.DataFrame()  # Empty dataframe as fallback
+        
+        if 'name' in frame.columns:
+            _name_lower = frame['name'].fillna('').astype(str).str.lower().to_numpy(dtype=str)
+            # Exact-name lookups become a dict hit; reversed so the first row wins on duplicates
+            _NAME_ROW = {name: i for i, name in reversed(list(enumerate(_name_lower.tolist()))) if name}
+        if 'appid' in frame.columns:
+            _APPID_ROW = {int(appid): i for i, appid in reversed(list(enumerate(frame['appid'].tolist())))
+                          if appid is not None and appid == appid}
+        search_fields = [
+            frame[col].astype(object).fillna('').astype(str).str.lower()
+            for col in SEARCH_COLUMNS if col in frame.columns
+        ]
+        if search_fields:
+            # UTF-8 bytes take a quarter of the memory of numpy's UTF-32 strings and scan faster;
+            # UTF-8 is self-synchronizing, so byte substring matches are character matches
+            _search_blob = np.char.encode(
+                search_fields[0].str.cat(search_fields[1:], sep='\x1f').to_numpy(dtype=str), 'utf-8'
+            )
+        if 'playtime_forever_hours' in frame.columns:
+            _playtime_hours = frame['playtime_forever_hours'].to_numpy(dtype=np.float64, na_value=np.nan)
+        _TOP_PLAYTIME_IDX = _playtime_order(frame, 'playtime_forever')
+        _TOP_2W_IDX = _playtime_order(frame, 'playtime_2weeks')
+        if 'playtime_2weeks' in frame.columns:
+            _RECENT_COUNT = int((frame['playtime_2weeks'] > 0).sum())
+        _build_category_codes(frame)
+        if 'review_summary' in frame.columns:
+            # Fixed filter used by recommendations - evaluate it once on the category codes
+            _HIGHLY_RATED = frame['review_summary'].isin(HIGHLY_RATED_REVIEWS).to_numpy(dtype=bool)
+        _GENRE_INDEX = _build_genre_index(frame)
+        try:
+            _LIBRARY_STATS = _compute_library_stats(frame)
+        except Exception as e:
+            # Don't let a malformed column take the rest of the library down with it
+            _LIBRARY_STATS = {'error': f"Failed to compute library stats: {str(e)}"}
+        df = frame
+    finally:
+        _library_ready.set()
+
+def _wait_for_library():
+    """Block until the background library load has finished"""
+    _library_ready.wait()
+
+# Parse the library off the import path so the MCP handshake isn't blocked on it
+threading.Thread(target=_init_library, name="library-loader", daemon=True).start()
+
+def _name_matches(needle: str) -> np.ndarray:
+    """Boolean mask of games whose name contains needle (case-insensitive, literal)"""
+    return np.char.find(_name_lower, needle.lower()) >= 0
+
+def _category_equals(column: str, value: str) -> np.ndarray:
+    """Case-insensitive equality mask for a column, compared on category codes when available"""
+    codes = _CAT_CODES.get(column)
+    if codes is None:
+        # Arrow-backed string comparisons yield <NA> for missing values, so fill before masking
+        return (df[column].str.lower() == value.lower()).fillna(False).to_numpy(dtype=bool)
+    matches = _CAT_LOOKUP[column].get(value.lower())
+    if matches is None:
+        return np.zeros(len(codes), dtype=bool)
+    if len(matches) == 1:
+        return codes == matches[0]
+    return np.isin(codes, matches)
+
+def _rows(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Convert a DataFrame slice to a list of plain-Python row dicts (missing values as None)"""
+    columns = list(frame.columns)
+    values = []
+    for col in columns:
+        series = frame[col]
+        # tolist() boxes a whole column at once; only columns with gaps pay for the NA scan
+        if series.hasnans:
+            values.append([None if v is pd.NA or v != v else v for v in series.tolist()])
+        else:
+            values.append(series.tolist())
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+def top_n_by_playtime(n: int) -> pd.DataFrame:
+    """Return the n most-played games (by total playtime)"""
+    _wait_for_library()
+    return df.iloc[_TOP_PLAYTIME_IDX[:n]]
+
+def _top_k_indices(values: np.ndarray, k: int) -> np.ndarray:
+    """Positions of the k largest values, largest first, with ties in original order like a stable sort"""
+    n = len(values)
+    if n > k:
+        # O(n) selection of the cutoff value; only the k survivors get sorted
+        threshold = np.partition(values, n - k)[n - k]
+        above = np.flatnonzero(values > threshold)
+        ties = np.flatnonzero(values == threshold)[:k - len(above)]
+        idx = np.concatenate((above, ties))
+    else:
+        idx = np.arange(n)
+    return idx[np.argsort(-values[idx], kind='stable')]
 
 # ============================================================================
 # PHASE 2: PERFORMANCE OPTIMIZATIONS
 # Caching, Parallel Execution, and Rate Limiting
 # ============================================================================
 
+def _approx_size(key: str, value: Any) -> int:
+    """Cheap size estimate (in bytes) of a cache entry: key length plus the value's repr length"""
+    return len(key) + len(repr(value))
+
+class _CacheShard:
+    """One independently locked LRU partition of a TTLCache"""
+    __slots__ = ('cache', 'lock', 'maxsize', 'hits', 'misses', 'nbytes')
+    
+    def __init__(self, maxsize: int):
+        self.cache: OrderedDict = OrderedDict()  # key -> (value, monotonic expiry, size), oldest use first
+        self.lock = threading.Lock()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0  # Sum of entry sizes, kept up to date on every insert and removal
+    
+    def put(self, key: str, value: Any, expiry: float):
+        """Insert or replace an entry and evict down to maxsize (caller holds the lock)"""
+        cache = self.cache
+        old = cache.get(key)
+        if old is not None:
+            self.nbytes -= old[2]
+        size = _approx_size(key, value)
+        cache[key] = (value, expiry, size)
+        cache.move_to_end(key)
+        self.nbytes += size
+        # Evict least recently used entries (LRU eviction)
+        while len(cache) > self.maxsize:
+            self.nbytes -= cache.popitem(last=False)[1][2]
+
 class TTLCache:
-    """Thread-safe time-based cache with automatic expiration"""
+    """Thread-safe LRU cache with time-based expiration"""
+    
+    SHARD_COUNT = 16
     
     def __init__(self, maxsize: int = 128, ttl: int = 900):
         """
         Initialize TTL cache
         
+        Keys are striped across independently locked shards so parallel API
+        calls touching different keys don't serialize on one lock. LRU order
+        and capacity are tracked per shard.
+        
         Args:
             maxsize: Maximum number of entries
             ttl: Time to live in seconds
         """
-        self.cache: Dict[str, tuple] = {}  # key -> (value, expiry_time)
         self.maxsize = maxsize
         self.ttl = ttl
-        self.hits = 0
-        self.misses = 0
-        self._lock = threading.Lock()
+        shard_count = max(1, min(self.SHARD_COUNT, maxsize))
+        base, extra = divmod(maxsize, shard_count)
+        self._shards = [_CacheShard(base + (1 if i < extra else 0)) for i in range(shard_count)]
+    
+    def _shard(self, key: str) -> _CacheShard:
+        """Shard responsible for key"""
+        return self._shards[hash(key) % len(self._shards)]
+    
+    def __len__(self) -> int:
+        return sum(len(shard.cache) for shard in self._shards)
+    
+    @property
+    def bytes(self) -> int:
+        """Approximate total size of the cached entries, tracked incrementally (no traversal)"""
+        return sum(shard.nbytes for shard in self._shards)
     
     def get(self, key: str) -> Optional[Any]:
         """Get value from cache if not expired"""
-        with self._lock:
-            if key in self.cache:
-                value, expiry = self.cache[key]
-                if time() < expiry:
-                    self.hits += 1
-                    return value
-                else:
-                    del self.cache[key]  # Expired
-            self.misses += 1
+        shard = self._shard(key)
+        cache = shard.cache
+        
+        # Fast path without the lock: OrderedDict.get is a single C call, atomic under
+        # the CPython GIL, and entries are immutable tuples replaced wholesale by set()
+        entry = cache.get(key)
+        if entry is not None and monotonic() < entry[1]:
+            # Refresh LRU position only if the shard is free - a skipped bump just
+            # makes eviction slightly less exact
+            if shard.lock.acquire(blocking=False):
+                try:
+                    if key in cache:
+                        cache.move_to_end(key)  # Mark as most recently used
+                finally:
+                    shard.lock.release()
+            shard.hits += 1  # Unlocked counter - small drift is acceptable for stats
+            return entry[0]
+        
+        with shard.lock:
+            entry = cache.get(key)
+            if entry is not None:
+                if monotonic() < entry[1]:
+                    cache.move_to_end(key)
+                    shard.hits += 1
+                    return entry[0]
+                del cache[key]  # Expired
+                shard.nbytes -= entry[2]
+            shard.misses += 1
             return None
     
-    def set(self, key: str, value: Any):
-        """Set value in cache with TTL"""
-        with self._lock:
-            # Remove oldest entry if at capacity (FIFO eviction)
-            if len(self.cache) >= self.maxsize:
-                oldest_key = next(iter(self.cache))
-                del self.cache[oldest_key]
-            
-            self.cache[key] = (value, time() + self.ttl)
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Set value in cache with TTL (the cache default unless ttl is given)"""
+        shard = self._shard(key)
+        with shard.lock:
+            shard.put(key, value, monotonic() + (self.ttl if ttl is None else ttl))
+    
+    def dump(self, path: str):
+        """Write unexpired entries to path so they survive a restart (best-effort)"""
+        entries = []
+        for shard in self._shards:
+            with shard.lock:
+                now = monotonic()
+                # Monotonic time doesn't carry across processes, so store remaining lifetimes
+                entries.extend((key, value, expiry - now) for key, (value, expiry, _) in shard.cache.items() if expiry > now)
+        try:
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'saved_at': time(), 'entries': entries}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)  # Atomic swap so readers never see a partial file
+        except Exception:
+            pass
+    
+    def load(self, path: str):
+        """Restore entries written by dump(), skipping any that expired meanwhile"""
+        try:
+            with open(path, 'rb') as f:
+                saved = pickle.load(f)
+            elapsed = time() - saved['saved_at']
+            entries = saved['entries']
+        except Exception:
+            return  # Missing or unreadable - start cold
+        now = monotonic()
+        for key, value, remaining in entries:
+            remaining -= elapsed
+            if remaining > 0:
+                shard = self._shard(key)
+                with shard.lock:
+                    shard.put(key, value, now + remaining)
     
     def clear(self):
         """Clear all cache entries"""
-        with self._lock:
-            self.cache.clear()
-            self.hits = 0
-            self.misses = 0
+        for shard in self._shards:
+            with shard.lock:
+                shard.cache.clear()
+                shard.nbytes = 0
+                shard.hits = 0
+                shard.misses = 0
     
     def stats(self) -> Dict[str, Any]:
         """Get cache statistics"""
-        with self._lock:
-            total = self.hits + self.misses
-            return {
-                'size': len(self.cache),
-                'maxsize': self.maxsize,
-                'hits': self.hits,
-                'misses': self.misses,
-                'hit_rate': round(self.hits / total * 100, 1) if total > 0 else 0.0,
-                'ttl_seconds': self.ttl
-            }
+        size = hits = misses = 0
+        for shard in self._shards:
+            with shard.lock:
+                size += len(shard.cache)
+                hits += shard.hits
+                misses += shard.misses
+        total = hits + misses
+        return {
+            'size': size,
+            'maxsize': self.maxsize,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total * 100, 1) if total > 0 else 0.0,
+            'ttl_seconds': self.ttl
+        }
 
 class ParallelExecutor:
-    """Execute independent tasks in parallel using ThreadPoolExecutor"""
+    """Execute independent tasks in parallel on the shared worker pool"""
     
-    def __init__(self, max_workers: int = 5):
+    def __init__(self, max_workers: int = 5, pool: Optional[ThreadPoolExecutor] = None):
         """
         Initialize parallel executor
         
         Args:
-            max_workers: Maximum number of concurrent threads
+            max_workers: Nominal batch width reported in stats
+            pool: Persistent pool to run tasks on (defaults to the shared _HTTP_POOL)
         """
         self.max_workers = max_workers
+        self._pool = pool
         self.completed_count = 0
         self.total_time_ms = 0.0
     
@@ -130,25 +583,36 @@ class ParallelExecutor:
             Dict mapping task names to results
         """
         results = {}
-        start_time = time()
+        start_time = perf_counter_ns()
         
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_name = {
-                executor.submit(func, *args, **kwargs): name
-                for name, func, args, kwargs in tasks
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_name):
-                name = future_to_name[future]
-                try:
-                    results[name] = future.result()
-                except Exception as e:
-                    results[name] = {"error": str(e)}
+        if not tasks:
+            return results
+        
+        # Submit all but the last task to the persistent pool (no per-batch thread startup)
+        pool = self._pool or _HTTP_POOL
+        future_to_name = {
+            pool.submit(func, *args, **kwargs): name
+            for name, func, args, kwargs in tasks[:-1]
+        }
+        
+        # Run the last task on the calling thread - it would only block waiting anyway,
+        # and nested batches can't starve the pool of workers
+        name, func, args, kwargs = tasks[-1]
+        try:
+            results[name] = func(*args, **kwargs)
+        except Exception as e:
+            results[name] = {"error": str(e)}
+        
+        # Collect results as they complete
+        for future in as_completed(future_to_name):
+            name = future_to_name[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = {"error": str(e)}
         
         # Track statistics
-        elapsed = (time() - start_time) * 1000  # Convert to ms
+        elapsed = (perf_counter_ns() - start_time) / 1_000_000  # Convert to ms
         self.completed_count += 1
         self.total_time_ms += elapsed
         
@@ -167,6 +631,9 @@ class TokenBucket:
         """
         Initialize token bucket rate limiter
         
+        Tokens are whole integers refilled from monotonic_ns(), so the bucket never
+        runs backwards on wall-clock adjustments and the hot path avoids float math.
+        
         Args:
             rate: Tokens per second (requests per second)
             capacity: Maximum burst capacity
@@ -174,9 +641,30 @@ class TokenBucket:
         self.rate = rate
         self.capacity = capacity
         self.tokens = capacity
-        self.last_update = time()
+        self.ns_per_token = int(1e9 / rate)
+        self.last_update_ns = monotonic_ns()
         self._lock = threading.Lock()
     
+    def _refill(self, now: int):
+        """Add the whole tokens earned since last_update_ns (caller holds the lock)"""
+        if self.tokens >= self.capacity:
+            self.last_update_ns = now  # Full bucket doesn't bank time
+            return
+        earned = (now - self.last_update_ns) // self.ns_per_token
+        if earned:
+            self.tokens = min(self.capacity, self.tokens + earned)
+            if self.tokens == self.capacity:
+                self.last_update_ns = now
+            else:
+                # Keep the partial progress towards the next token
+                self.last_update_ns += earned * self.ns_per_token
+    
+    def _wait_ns(self, now: int) -> int:
+        """Nanoseconds until the next token (caller holds the lock)"""
+        if self.tokens >= 1:
+            return 0
+        return max(0, self.ns_per_token - (now - self.last_update_ns))
+    
     def consume(self, tokens: int = 1) -> bool:
         """
         Try to consume tokens from the bucket
@@ -187,13 +675,17 @@ class TokenBucket:
         Returns:
             True if tokens were consumed, False if rate limited
         """
+        now = monotonic_ns()
+        
+        # Lock-free rejection while the bucket is still refilling: two attribute reads
+        # are enough to know no token can be due yet, so throttled callers (which
+        # poll consume() in a retry loop) never contend with the lock
+        available = self.tokens
+        if available < tokens and now - self.last_update_ns < (tokens - available) * self.ns_per_token:
+            return False
+        
         with self._lock:
-            now = time()
-            
-            # Refill tokens based on elapsed time
-            elapsed = now - self.last_update
-            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
-            self.last_update = now
+            self._refill(monotonic_ns())  # Re-read the clock - another thread may have refilled meanwhile
             
             # Try to consume tokens
             if self.tokens >= tokens:
@@ -205,38 +697,54 @@ class TokenBucket:
     def wait_time(self) -> float:
         """Calculate time to wait until next token is available"""
         with self._lock:
-            if self.tokens >= 1:
-                return 0.0
-            return (1 - self.tokens) / self.rate
+            now = monotonic_ns()
+            self._refill(now)
+            return self._wait_ns(now) / 1e9
     
     def stats(self) -> Dict[str, Any]:
         """Get current bucket statistics"""
         with self._lock:
+            now = monotonic_ns()
+            self._refill(now)
+            partial = 0.0
+            if self.tokens < self.capacity:
+                partial = (now - self.last_update_ns) / self.ns_per_token
             return {
-                'tokens_available': round(self.tokens, 2),
+                'tokens_available': round(self.tokens + partial, 2),
                 'capacity': self.capacity,
                 'rate_per_second': self.rate,
-                'wait_time_seconds': round(self.wait_time(), 2)
+                'wait_time_seconds': round(self._wait_ns(now) / 1e9, 2)
             }
 
 class CircuitBreaker:
     """Circuit breaker pattern for API failure handling"""
     
-    def __init__(self, failure_threshold: int = 5, timeout: float = 60.0):
+    def __init__(self, failure_threshold: int = 5, timeout: float = 60.0, max_timeout: float = 300.0):
         """
         Initialize circuit breaker
         
+        Each failed half-open probe doubles the wait before the next one (up to
+        max_timeout), so a persistently down API isn't probed every timeout seconds.
+        A successful probe closes the circuit and restores the base timeout.
+        
         Args:
             failure_threshold: Number of failures before opening circuit
             timeout: Seconds to wait before attempting to close circuit
+            max_timeout: Upper bound for the backed-off wait
         """
         self.failure_threshold = failure_threshold
         self.timeout = timeout
+        self.max_timeout = max_timeout
+        self.reopen_count = 0  # Failed half-open probes since the circuit last closed
         self.failure_count = 0
         self.last_failure_time = 0.0
         self.state = 'closed'  # closed, open, half_open
         self._lock = threading.Lock()
     
+    def current_timeout(self) -> float:
+        """Seconds the circuit stays open before the next half-open probe"""
+        return min(self.timeout * (2 ** self.reopen_count), self.max_timeout)
+    
     def call(self, func, *args, **kwargs):
         """
         Execute function with circuit breaker protection
@@ -248,31 +756,41 @@ class CircuitBreaker:
         Returns:
             Function result or raises exception
         """
-        with self._lock:
-            if self.state == 'open':
-                # Check if timeout has passed
-                if time() - self.last_failure_time >= self.timeout:
-                    self.state = 'half_open'
-                else:
-                    raise Exception(f"Circuit breaker OPEN - API unavailable (retry in {self.timeout - (time() - self.last_failure_time):.0f}s)")
+        # A closed breaker needs no lock to let the call through
+        if self.state != 'closed':
+            with self._lock:
+                if self.state == 'open':
+                    # Check if timeout has passed
+                    remaining = self.current_timeout() - (monotonic() - self.last_failure_time)
+                    if remaining <= 0:
+                        self.state = 'half_open'
+                    else:
+                        raise Exception(f"Circuit breaker OPEN - API unavailable (retry in {remaining:.0f}s)")
         
         try:
             result = func(*args, **kwargs)
             
-            with self._lock:
-                # Success - close circuit
-                if self.state == 'half_open':
-                    self.state = 'closed'
-                self.failure_count = 0
+            # Healthy API (closed, no failures) has nothing to reset - skip the lock
+            if self.state != 'closed' or self.failure_count:
+                with self._lock:
+                    # Success - close circuit
+                    if self.state == 'half_open':
+                        self.state = 'closed'
+                        self.reopen_count = 0
+                    self.failure_count = 0
             
             return result
             
         except Exception as e:
             with self._lock:
                 self.failure_count += 1
-                self.last_failure_time = time()
+                self.last_failure_time = monotonic()
                 
-                if self.failure_count >= self.failure_threshold:
+                if self.state == 'half_open':
+                    # Probe failed - reopen with a longer wait
+                    self.reopen_count += 1
+                    self.state = 'open'
+                elif self.failure_count >= self.failure_threshold:
                     self.state = 'open'
             
             raise e
@@ -282,6 +800,7 @@ class CircuitBreaker:
         with self._lock:
             self.state = 'closed'
             self.failure_count = 0
+            self.reopen_count = 0
             self.last_failure_time = 0.0
     
     def stats(self) -> Dict[str, Any]:
@@ -291,10 +810,15 @@ class CircuitBreaker:
                 'state': self.state,
                 'failure_count': self.failure_count,
                 'failure_threshold': self.failure_threshold,
-                'time_since_last_failure': round(time() - self.last_failure_time, 1) if self.last_failure_time > 0 else None
+                'current_timeout': self.current_timeout(),
+                'time_since_last_failure': round(monotonic() - self.last_failure_time, 1) if self.last_failure_time > 0 else None
             }
 
-def exponential_backoff(func, *args, max_retries: int = 3, base_delay: float = 1.0, **kwargs):
+class TransientAPIError(Exception):
+    """Steam API failure worth retrying (rate limited or server error)"""
+
+def exponential_backoff(func, *args, max_retries: int = 3, base_delay: float = 1.0,
+                        retriable: tuple = (Exception,), **kwargs):
     """
     Retry function with exponential backoff
     
@@ -303,6 +827,7 @@ def exponential_backoff(func, *args, max_retries: int = 3, base_delay: float = 1
         *args, **kwargs: Function arguments
         max_retries: Maximum number of retry attempts
         base_delay: Base delay in seconds (doubles each retry)
+        retriable: Exception types that trigger a retry; anything else is raised at once
         
     Returns:
         Function result
@@ -310,7 +835,7 @@ def exponential_backoff(func, *args, max_retries: int = 3, base_delay: float = 1
     for attempt in range(max_retries + 1):
         try:
             return func(*args, **kwargs)
-        except Exception as e:
+        except retriable as e:
             if attempt == max_retries:
                 # Last attempt failed, raise exception
                 raise e
@@ -319,13 +844,11 @@ def exponential_backoff(func, *args, max_retries: int = 3, base_delay: float = 1
             delay = base_delay * (2 ** attempt)
             
             # Add jitter (random 0-25% of delay)
-            import random
             jitter = delay * 0.25 * random.random()
             total_delay = delay + jitter
             
             # Sleep before retry
-            import time as time_module
-            time_module.sleep(total_delay)
+            sleep(total_delay)
 
 class AchievementDependencyDetector:
     """Detect and analyze achievement dependencies from descriptions"""
@@ -360,9 +883,68 @@ class AchievementDependencyDetector:
         (r'(?:then|next) ([a-zA-Z\s]+)', 'sequence'),
     ]
     
+    # Compiled once at class creation instead of re-parsed for every description.
+    # Descriptions are lowercased before matching, so no IGNORECASE is needed.
+    _COMPILED_PATTERNS = [(re.compile(pattern), dep_type)
+                          for pattern, dep_type in DEPENDENCY_PATTERNS]
+    
+    # All patterns as one alternation - a single scan rules out descriptions with no
+    # dependency text at all (the common case) before running the per-pattern findall
+    _ANY_PATTERN = re.compile('|'.join(f'(?:{pattern})' for pattern, _ in DEPENDENCY_PATTERNS))
+    
+    GRAPH_CACHE_MAXSIZE = 128
+    
     def __init__(self):
         """Initialize dependency detector"""
-        self.dependency_cache = {}
+        # LRU of ((name, description), ...) -> dependency graph
+        self.dependency_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+    
+    @staticmethod
+    def _name_matcher(names_lower: List[str]):
+        """
+        Build a lookup of the names related to a referenced phrase
+        
+        A name is related when it contains the phrase or the phrase contains it.
+        Names are indexed once per detection run so each lookup is linear in the
+        phrase/name text instead of a Python loop over every achievement.
+        
+        Args:
+            names_lower: Lowercased achievement names
+            
+        Returns:
+            Function mapping a lowercased phrase to sorted indices into names_lower
+        """
+        # Phrase inside a name: C-level find over all names joined by a separator
+        haystack = '\x00'.join(names_lower)
+        starts = [0] + list(accumulate(len(n) + 1 for n in names_lower))
+        
+        # Name inside the phrase: Aho-Corasick automaton over the names when available
+        automaton = None
+        empty_names = [i for i, n in enumerate(names_lower) if not n]
+        if ahocorasick is not None and len(empty_names) < len(names_lower):
+            automaton = ahocorasick.Automaton()
+            for i, n in enumerate(names_lower):
+                if n:
+                    automaton.add_word(n, i)
+            automaton.make_automaton()
+        
+        def related(phrase: str) -> List[int]:
+            if not phrase:
+                return list(range(len(names_lower)))
+            found = set(empty_names)
+            pos = haystack.find(phrase)
+            while pos != -1:
+                idx = bisect_right(starts, pos) - 1
+                found.add(idx)
+                pos = haystack.find(phrase, starts[idx + 1])  # Skip to the next name
+            if automaton is not None:
+                found.update(idx for _, idx in automaton.iter(phrase))
+            else:
+                found.update(i for i, n in enumerate(names_lower) if n in phrase)
+            return sorted(found)
+        
+        return related
     
     def detect_dependencies(self, achievements: List[Dict[str, Any]]) -> Dict[str, List[str]]:
         """
@@ -376,30 +958,35 @@ class AchievementDependencyDetector:
         """
         dependencies = {}
         achievement_names = {ach['name'].lower(): ach['name'] for ach in achievements}
+        actual_names = list(achievement_names.values())
+        related_names = None  # Built on first named reference
         
         for ach in achievements:
             name = ach['name']
             description = ach.get('description', '').lower()
+            if not self._ANY_PATTERN.search(description):
+                continue
             
             prerequisites = []
             
             # Check each pattern
-            for pattern, dep_type in self.DEPENDENCY_PATTERNS:
-                matches = re.findall(pattern, description, re.IGNORECASE)
+            for regex, dep_type in self._COMPILED_PATTERNS:
+                matches = regex.findall(description)
                 
                 for match in matches:
                     # For named prerequisites, try to match to actual achievement names
                     if dep_type in ['after', 'requires', 'must_have', 'prerequisite']:
-                        match_lower = match.lower()
-                        # Find closest matching achievement name
-                        for ach_name_lower, ach_name_actual in achievement_names.items():
-                            if match_lower in ach_name_lower or ach_name_lower in match_lower:
-                                if ach_name_actual != name:
-                                    prerequisites.append({
-                                        'achievement': ach_name_actual,
-                                        'type': dep_type,
-                                        'reference': match
-                                    })
+                        if related_names is None:
+                            related_names = self._name_matcher(list(achievement_names))
+                        # Find closest matching achievement names (description is already lowercase)
+                        for idx in related_names(match):
+                            ach_name_actual = actual_names[idx]
+                            if ach_name_actual != name:
+                                prerequisites.append({
+                                    'achievement': ach_name_actual,
+                                    'type': dep_type,
+                                    'reference': match
+                                })
                     
                     # For numeric/progression prerequisites
                     elif dep_type in ['level', 'chapter', 'act', 'stage', 'mission']:
@@ -427,8 +1014,18 @@ class AchievementDependencyDetector:
         Build a directed acyclic graph of achievement dependencies
         
         Returns:
-            Dict with 'nodes', 'edges', and 'levels' (topological sort)
+            Dict with 'nodes', 'edges', and 'levels' (topological sort), plus
+            'level_index' mapping each achievement name to its level. The dict is
+            cached and shared between callers, so treat it as read-only.
         """
+        # The roadmap, dependency analysis and get_optimal_order all build the same game's graph
+        key = tuple((ach['name'], ach.get('description', '')) for ach in achievements)
+        with self._cache_lock:
+            hit = self.dependency_cache.get(key)
+            if hit is not None:
+                self.dependency_cache.move_to_end(key)
+                return hit
+        
         dependencies = self.detect_dependencies(achievements)
         
         # Build adjacency list (achievement -> prerequisites)
@@ -446,40 +1043,57 @@ class AchievementDependencyDetector:
         # Topological sort (Kahn's algorithm)
         levels = self._topological_sort(graph, reverse_graph)
         
-        return {
+        # Inverted once so callers look up a name's level instead of scanning every level list
+        level_index = {}
+        for level_idx, level in enumerate(levels):
+            for ach_name in level:
+                level_index.setdefault(ach_name, level_idx)
+        
+        result = {
             'dependencies': dependencies,
             'graph': graph,
             'reverse_graph': reverse_graph,
             'levels': levels,
+            'level_index': level_index,
             'total_dependencies': sum(len(deps) for deps in dependencies.values())
         }
+        with self._cache_lock:
+            self.dependency_cache[key] = result
+            if len(self.dependency_cache) > self.GRAPH_CACHE_MAXSIZE:
+                self.dependency_cache.popitem(last=False)
+        return result
     
-    def _topological_sort(self, graph: Dict[str, List[str]], reverse_graph: Dict[str, List[str]]) -> List[List[str]]:
+    def _topological_sort(self, graph: Dict[str, List[str]], reverse_graph: Dict[str, List[str]],
+                          deterministic: bool = True) -> List[List[str]]:
         """
         Perform topological sort to determine optimal achievement order
         
+        Args:
+            graph: Achievement -> prerequisites
+            reverse_graph: Prerequisite -> dependents
+            deterministic: Sort each level by name (skip for internal callers that don't need stable output)
+        
         Returns:
             List of levels, where each level contains achievements that can be done in parallel
         """
         # Count in-degrees (number of prerequisites)
         in_degree = {node: len(prereqs) for node, prereqs in graph.items()}
         
-        # Start with nodes that have no prerequisites
+        # Start with nodes that have no prerequisites; one queue is reused for every level
         levels = []
-        current_level = [node for node, degree in in_degree.items() if degree == 0]
+        current = deque(node for node, degree in in_degree.items() if degree == 0)
         
-        while current_level:
-            levels.append(sorted(current_level))  # Sort for deterministic output
-            next_level = []
+        while current:
+            level = list(current)
+            current.clear()
+            levels.append(sorted(level) if deterministic else level)
             
-            for node in current_level:
+            for node in level:
                 # For each dependent of this node
                 for dependent in reverse_graph[node]:
                     in_degree[dependent] -= 1
-                    if in_degree[dependent] == 0:
-                        next_level.append(dependent)
-            
-            current_level = next_level
+                    if not in_degree[dependent]:
+                        current.append(dependent)
         
         return levels
     
@@ -509,9 +1123,75 @@ class AchievementDependencyDetector:
 class DifficultyPredictor:
     """ML-based achievement difficulty prediction"""
     
+    # Difficulty keyword patterns by tier, compiled once (matched against lowercased text)
+    KEYWORD_INDICATORS = {
+        difficulty: [(keyword, re.compile(keyword)) for keyword in keywords]
+        for difficulty, keywords in {
+            'very_hard': ['perfect', 'flawless', 'no damage', 'no deaths', 'speedrun', 'under \\d+ seconds'],
+            'hard': ['difficult', 'challenging', 'master', 'expert', 'hardest', 'nightmare'],
+            'medium': ['complete', 'finish', 'defeat', 'all'],
+            'easy': ['first', 'tutorial', 'basic', 'simple', 'easy'],
+            'grind': ['collect all', '\\d{3,}', 'every', 'maximum']
+        }.items()
+    }
+    
+    # Time requirement patterns -> score (0-100)
+    TIME_INDICATORS = [
+        (re.compile(indicator), score)
+        for indicator, score in {
+            'quick': 10,
+            'fast': 15,
+            'short': 20,
+            'normal': 40,
+            'long': 60,
+            'extended': 75,
+            'marathon': 90,
+            'collect all': 80,
+            '\\d{3,}': 70,  # Large numbers suggest grinding
+        }.items()
+    ]
+    
+    # One alternation per tier/analyzer: a single scan skips the per-keyword searches
+    # when nothing in the group can match (most descriptions hit only one or two tiers)
+    _KEYWORD_TIER_ANY = {
+        difficulty: re.compile('|'.join(keyword for keyword, _ in keywords))
+        for difficulty, keywords in KEYWORD_INDICATORS.items()
+    }
+    
+    # Skill requirement words -> score (0-100)
+    SKILL_INDICATORS = {
+        'perfect': 100,
+        'flawless': 95,
+        'no damage': 90,
+        'no deaths': 85,
+        'speedrun': 80,
+        'expert': 75,
+        'master': 70,
+        'hard mode': 70,
+        'difficult': 65,
+        'challenging': 60,
+        'skilled': 55,
+        'timing': 50,
+        'precise': 50,
+    }
+    
+    # Time and skill indicators as one alternation, one capture group per indicator.
+    # Wrapped in a lookahead so every start position is tried and overlapping
+    # indicators are all seen, matching the separate per-indicator searches.
+    _TIME_SKILL_SCORES = [(True, score) for _, score in TIME_INDICATORS] + \
+                         [(False, score) for score in SKILL_INDICATORS.values()]
+    _TIME_SKILL_PATTERN = re.compile('(?=' + '|'.join(
+        [f'({regex.pattern})' for regex, _ in TIME_INDICATORS] +
+        [f'({re.escape(indicator)})' for indicator in SKILL_INDICATORS]
+    ) + ')')
+    
+    CACHE_MAXSIZE = 4096
+    
     def __init__(self):
         """Initialize difficulty predictor"""
-        self.difficulty_cache = {}
+        # LRU of (name, description, global rarity) -> prediction
+        self.difficulty_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def predict_difficulty(self, achievement: Dict[str, Any], global_rarity: float) -> Dict[str, Any]:
         """
@@ -530,7 +1210,15 @@ class DifficultyPredictor:
         Returns:
             Dict with difficulty score, category, and breakdown
         """
-        description = achievement.get('description', '').lower()
+        raw_description = achievement.get('description', '')
+        key = (achievement.get('name'), raw_description, global_rarity)
+        with self._cache_lock:
+            hit = self.difficulty_cache.get(key)
+            if hit is not None:
+                self.difficulty_cache.move_to_end(key)
+                return hit
+        
+        description = raw_description.lower()
         
         # Factor 1: Rarity score (0-100, inverted so rare = high difficulty)
         rarity_score = 100 - global_rarity
@@ -538,11 +1226,8 @@ class DifficultyPredictor:
         # Factor 2: Keyword-based difficulty indicators
         keyword_scores = self._analyze_keywords(description)
         
-        # Factor 3: Time/grind requirements
-        time_score = self._analyze_time_requirement(description)
-        
-        # Factor 4: Skill requirements
-        skill_score = self._analyze_skill_requirement(description)
+        # Factors 3 and 4: Time/grind and skill requirements (shared scan)
+        time_score, skill_score = self._analyze_time_and_skill(description)
         
         # Weighted combination (rarity is most reliable)
         weights = {
@@ -579,7 +1264,7 @@ class DifficultyPredictor:
             category = 'very_hard'
             estimated_time = '3+ hours'
         
-        return {
+        result = {
             'score': round(difficulty_score, 1),
             'category': category,
             'estimated_time': estimated_time,
@@ -596,24 +1281,25 @@ class DifficultyPredictor:
                 'skill_requirement': self._skill_category(skill_score)
             }
         }
+        
+        with self._cache_lock:
+            self.difficulty_cache[key] = result
+            if len(self.difficulty_cache) > self.CACHE_MAXSIZE:
+                self.difficulty_cache.popitem(last=False)
+        return result
     
     def _analyze_keywords(self, description: str) -> Dict[str, Any]:
         """Analyze description for difficulty indicator keywords"""
-        indicators = {
-            'very_hard': ['perfect', 'flawless', 'no damage', 'no deaths', 'speedrun', 'under \\d+ seconds'],
-            'hard': ['difficult', 'challenging', 'master', 'expert', 'hardest', 'nightmare'],
-            'medium': ['complete', 'finish', 'defeat', 'all'],
-            'easy': ['first', 'tutorial', 'basic', 'simple', 'easy'],
-            'grind': ['collect all', '\\d{3,}', 'every', 'maximum']
-        }
-        
         scores = {}
         found_indicators = []
         
-        for difficulty, keywords in indicators.items():
+        for difficulty, keywords in self.KEYWORD_INDICATORS.items():
             count = 0
-            for keyword in keywords:
-                if re.search(keyword, description, re.IGNORECASE):
+            if not self._KEYWORD_TIER_ANY[difficulty].search(description):
+                scores[difficulty] = count
+                continue
+            for keyword, regex in keywords:
+                if regex.search(description):
                     count += 1
                     found_indicators.append(f"{difficulty}: {keyword}")
             scores[difficulty] = count
@@ -635,53 +1321,29 @@ class DifficultyPredictor:
             'indicators': found_indicators[:3]  # Top 3
         }
     
-    def _analyze_time_requirement(self, description: str) -> float:
-        """Estimate time requirement from description (0-100 scale)"""
-        time_indicators = {
-            'quick': 10,
-            'fast': 15,
-            'short': 20,
-            'normal': 40,
-            'long': 60,
-            'extended': 75,
-            'marathon': 90,
-            'collect all': 80,
-            '\\d{3,}': 70,  # Large numbers suggest grinding
-        }
-        
-        max_score = 0
-        for indicator, score in time_indicators.items():
-            if re.search(indicator, description, re.IGNORECASE):
-                max_score = max(max_score, score)
-        
-        # Default to medium if no indicators
-        return max_score if max_score > 0 else 40
-    
-    def _analyze_skill_requirement(self, description: str) -> float:
-        """Estimate skill requirement from description (0-100 scale)"""
-        skill_indicators = {
-            'perfect': 100,
-            'flawless': 95,
-            'no damage': 90,
-            'no deaths': 85,
-            'speedrun': 80,
-            'expert': 75,
-            'master': 70,
-            'hard mode': 70,
-            'difficult': 65,
-            'challenging': 60,
-            'skilled': 55,
-            'timing': 50,
-            'precise': 50,
-        }
-        
-        max_score = 0
-        for indicator, score in skill_indicators.items():
-            if re.search(indicator, description, re.IGNORECASE):
-                max_score = max(max_score, score)
+    def _analyze_time_and_skill(self, description: str) -> tuple:
+        """
+        Estimate time and skill requirements from description in one regex pass
         
-        # Default to low-medium if no indicators
-        return max_score if max_score > 0 else 30
+        Args:
+            description: Lowercased achievement description
+            
+        Returns:
+            (time score, skill score), each on a 0-100 scale
+        """
+        max_time = max_skill = 0
+        scores = self._TIME_SKILL_SCORES
+        for match in self._TIME_SKILL_PATTERN.finditer(description):
+            is_time, score = scores[match.lastindex - 1]
+            if is_time:
+                if score > max_time:
+                    max_time = score
+            elif score > max_skill:
+                max_skill = score
+        
+        # Default to medium time / low-medium skill if no indicators
+        return (max_time if max_time > 0 else 40,
+                max_skill if max_skill > 0 else 30)
     
     def _time_category(self, score: float) -> str:
         """Convert time score to category"""
@@ -702,8 +1364,62 @@ api_cache = TTLCache(maxsize=200, ttl=900)   # 15 min for API responses
 tool_cache = TTLCache(maxsize=100, ttl=300)  # 5 min for tool results  
 guide_cache = TTLCache(maxsize=500, ttl=3600)  # 60 min for guide content
 
+# Per-endpoint API cache lifetimes; anything not listed uses api_cache's default
+API_CACHE_TTLS = {
+    '/GetSchemaForGame/': 24 * 3600,  # Achievement schemas practically never change
+    '/GetPlayerAchievements/': 60,    # Player progress should show new unlocks quickly
+    '/GetNumberOfCurrentPlayers/': 60,  # Live counts - reuse for repeated polls, but not for 15 minutes
+}
+
+def _api_ttl(endpoint: str) -> Optional[float]:
+    """Cache lifetime override for endpoint, or None for the default"""
+    for fragment, ttl in API_CACHE_TTLS.items():
+        if fragment in endpoint:
+            return ttl
+    return None
+error_cache = TTLCache(maxsize=100, ttl=10)  # 10 s for failed API calls
+
+# Stands in for a None (client error) result in error_cache, whose get() uses None for a miss
+_API_NO_RESULT = object()
+
+# Persist API responses across restarts so enrichments aren't re-fetched from Steam
+API_CACHE_PATH = os.path.join(script_dir, "steam_api_cache.pkl")
+api_cache.load(API_CACHE_PATH)
+atexit.register(api_cache.dump, API_CACHE_PATH)
+
+# Shared worker pool for Steam API fan-out - threads are created once, not per batch
+HTTP_POOL_WORKERS = min(32, (os.cpu_count() or 4) * 5)
+_HTTP_POOL = ThreadPoolExecutor(max_workers=HTTP_POOL_WORKERS, thread_name_prefix="steam-http")
+atexit.register(_HTTP_POOL.shutdown, wait=False)
+
+# (connect, read) timeouts - an unreachable host frees its worker after a few seconds
+# instead of holding it for the full read timeout
+HTTP_CONNECT_TIMEOUT = 3.05
+HTTP_TIMEOUT = (HTTP_CONNECT_TIMEOUT, 10)
+
+# Shared HTTP session - keeps TCP/TLS connections alive across Steam calls.
+# Adapter retries only cover connection failures; HTTP 429/5xx still surface to
+# exponential_backoff and the circuit breaker so they are counted there.
+http_session = requests.Session()
+_http_adapter = HTTPAdapter(
+    pool_connections=HTTP_POOL_WORKERS,
+    pool_maxsize=HTTP_POOL_WORKERS,
+    max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3)
+)
+http_session.mount("https://", _http_adapter)
+http_session.mount("http://", _http_adapter)
+# Community pages reject the default python-requests agent; set a browser UA once for all calls
+http_session.headers['User-Agent'] = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+atexit.register(http_session.close)
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, with orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
 # Global parallel executor
-executor = ParallelExecutor(max_workers=5)
+executor = ParallelExecutor(max_workers=5, pool=_HTTP_POOL)
 
 # Global rate limiter and circuit breaker (PHASE 2.2)
 # Steam Web API limits: ~200 requests/5 minutes = ~0.67 requests/second
@@ -715,14 +1431,62 @@ circuit_breaker = CircuitBreaker(failure_threshold=5, timeout=60.0)
 dependency_detector = AchievementDependencyDetector()
 difficulty_predictor = DifficultyPredictor()
 
+# Precompiled regexes shared by the tools
+_RE_GUIDE_ID = re.compile(r'sharedfiles/filedetails/\?id=(\d+)')
+_RE_VANITY_URL = re.compile(r'steamcommunity\.com/id/([^/]+)')
+
+# Missable content patterns, most critical first (matched against lowercased text)
+MISSABLE_PATTERNS = [
+    re.compile(pattern) for pattern in [
+        r'\bmissable\b',
+        r'point of no return',
+        r'before (chapter|act|stage|level|mission) \d+',
+        r'limited time',
+        r'one (chance|shot|time|playthrough)',
+        r"can't (go back|return|redo|replay)",
+        r'permanently (locked|missed|unavailable)',
+        r'(story|dialogue|conversation) (choice|decision)',
+        r'must (do|complete|finish) before',
+        r'(time|event)[-\s]sensitive',
+        r'no second chance'
+    ]
+]
+
+# Missable warnings sit near the top of a guide, so only this many leading characters are scanned
+MISSABLE_SCAN_PREFIX_CHARS = 32768
+
+# Cache keys need speed, not cryptographic strength - prefer xxh3 when installed
+try:
+    from xxhash import xxh3_64_hexdigest as _cache_hash
+except ImportError:
+    def _cache_hash(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 def cache_key(*args, **kwargs) -> str:
     """Generate cache key from function arguments"""
     try:
-        key_data = json.dumps({'args': args, 'kwargs': kwargs}, sort_keys=True, default=str)
-        return hashlib.md5(key_data.encode()).hexdigest()
+        # Pickle is typed (1 != '1') and much cheaper than a sorted JSON dump
+        key_data = pickle.dumps((args, sorted(kwargs.items())), protocol=5)
+        return _cache_hash(key_data)
     except Exception:
         # Fallback for non-serializable args
-        return hashlib.md5(str((args, kwargs)).encode()).hexdigest()
+        return _cache_hash(str((args, kwargs)).encode())
+
+def _api_cache_key(endpoint: str, params: Dict[str, Any]) -> Any:
+    """
+    Cache key for a Steam API request
+    
+    Uses a plain tuple that the cache dict hashes natively - no JSON dump or digest
+    on every lookup. The API key is left out so it is never stored in the (persisted)
+    cache; it doesn't change the response anyway.
+    """
+    try:
+        key = (endpoint, tuple(sorted((k, v) for k, v in params.items() if k != 'key')))
+        hash(key)
+        return key
+    except TypeError:
+        # Unhashable/unorderable params - fall back to the serialized digest
+        return f"api:{endpoint}:{cache_key({k: v for k, v in params.items() if k != 'key'})}"
 
 # Helper function for Steam API calls with caching, rate limiting, and circuit breaker
 def call_steam_api(endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
@@ -735,13 +1499,18 @@ def call_steam_api(endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
     - Exponential backoff: Retries with exponential delay
     """
     # Generate cache key from endpoint and params
-    key = f"api:{endpoint}:{cache_key(params)}"
+    key = _api_cache_key(endpoint, params)
     
     # Try cache first (bypass rate limiting for cached responses)
     cached = api_cache.get(key)
     if cached is not None:
         return cached
     
+    # Recent failures for the same call are replayed instead of hitting the limiter again
+    failed = error_cache.get(key)
+    if failed is not None:
+        return None if failed is _API_NO_RESULT else failed
+    
     # PHASE 2.2: Rate limiting - wait for token
     max_wait_attempts = 3
     for wait_attempt in range(max_wait_attempts):
@@ -751,23 +1520,24 @@ def call_steam_api(endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
         # Rate limited - wait before retry
         wait_time = rate_limiter.wait_time()
         if wait_attempt < max_wait_attempts - 1:
-            import time as time_module
-            time_module.sleep(min(wait_time, 2.0))  # Cap wait at 2 seconds
+            sleep(min(wait_time, 2.0))  # Cap wait at 2 seconds
         else:
             # Max wait attempts exceeded
-            return {'error': 'Rate limit exceeded - too many requests'}
+            result = {'error': 'Rate limit exceeded - too many requests'}
+            error_cache.set(key, result)
+            return result
     
     # PHASE 2.2: Circuit breaker + Exponential backoff
     def _api_call():
-        response = requests.get(endpoint, params=params, timeout=10)
+        response = http_session.get(endpoint, params=params, timeout=HTTP_TIMEOUT)
         if response.status_code == 200:
-            return response.json()
+            return _response_json(response)
         elif response.status_code == 429:
             # Rate limited by API
-            raise Exception(f"Steam API rate limit (429)")
+            raise TransientAPIError(f"Steam API rate limit (429)")
         elif response.status_code >= 500:
             # Server error - retryable
-            raise Exception(f"Steam API server error ({response.status_code})")
+            raise TransientAPIError(f"Steam API server error ({response.status_code})")
         else:
             # Client error - not retryable
             return None
@@ -778,36 +1548,38 @@ def call_steam_api(endpoint: str, params: Dict[str, Any]) -> Optional[Dict]:
             exponential_backoff,
             _api_call,
             max_retries=2,
-            base_delay=0.5
+            base_delay=0.5,
+            # Bad payloads and bugs fail fast instead of sleeping through retries
+            retriable=(TransientAPIError, requests.ConnectionError, requests.Timeout)
         )
         
         # Store in cache
         if result is not None:
-            api_cache.set(key, result)
+            api_cache.set(key, result, ttl=_api_ttl(endpoint))
+        else:
+            error_cache.set(key, _API_NO_RESULT)
         return result
         
     except Exception as e:
         # Circuit breaker open or max retries exceeded
-        return {'error': str(e)}
+        result = {'error': str(e)}
+        error_cache.set(key, result)
+        return result
 
 @mcp.tool
 def search_games(
     query: Annotated[str, "Search term to match against game name, genre, developer, or publisher"]
 ) -> List[Dict[str, Any]]:
     """Search for games by name, genre, developer, or publisher"""
+    _wait_for_library()
     if df.empty:
         return []
     
-    query_lower = query.lower()
-    # Search across multiple fields
-    mask = (
-        df['name'].str.lower().str.contains(query_lower, na=False) |
-        df['genres'].str.lower().str.contains(query_lower, na=False) |
-        df['developers'].str.lower().str.contains(query_lower, na=False) |
-        df['publishers'].str.lower().str.contains(query_lower, na=False)
-    )
+    # Search across multiple fields with one literal pass over the pre-lowercased blob
+    mask = np.char.find(_search_blob, query.lower().encode('utf-8')) >= 0
     
-    results = df[mask][['appid', 'name', 'genres', 'review_summary', 'playtime_forever_hours']].to_dict('records')
+    # Select rows and the returned columns in one take instead of copying every column
+    results = _rows(df.loc[mask, SUMMARY_COLUMNS])
     return results
 
 @mcp.tool
@@ -818,51 +1590,103 @@ def filter_games(
     maturity_rating: Annotated[Optional[str], "Maturity rating to filter by (e.g., 'Everyone', 'Teen (13+)')"] = None
 ) -> List[Dict[str, Any]]:
     """Filter games by playtime, review summary, or maturity rating"""
+    _wait_for_library()
     if df.empty:
         return []
     
-    filtered = df.copy()
+    # Build one boolean mask in place, then take the matching rows once
+    mask = np.ones(len(df), dtype=bool)
     
     if playtime_min is not None:
-        filtered = filtered[filtered['playtime_forever_hours'] >= playtime_min]
+        mask &= _playtime_hours >= playtime_min
     
     if playtime_max is not None:
-        filtered = filtered[filtered['playtime_forever_hours'] <= playtime_max]
+        mask &= _playtime_hours <= playtime_max
     
     if review_summary:
-        filtered = filtered[filtered['review_summary'].str.lower() == review_summary.lower()]
+        mask &= _category_equals('review_summary', review_summary)
     
     if maturity_rating:
-        filtered = filtered[filtered['maturity_rating'].str.lower() == maturity_rating.lower()]
+        mask &= _category_equals('maturity_rating', maturity_rating)
     
-    results = filtered[['appid', 'name', 'genres', 'review_summary', 'playtime_forever_hours']].to_dict('records')
+    results = _rows(df.loc[mask, SUMMARY_COLUMNS])
     return results
 
+FUZZY_MATCH_CUTOFF = 75  # Minimum rapidfuzz WRatio score for a typo match
+
+@lru_cache(maxsize=4096)
+def _resolve_key_row(key: str) -> Optional[int]:
+    """
+    Row position of the game matching a normalized (stripped, lowercased) identifier, or None
+    
+    Memoized: every achievement/guide/news tool resolves its game through
+    get_game_details, usually with the same few identifiers. The library is
+    loaded once, so positions never go stale. Only the row position is cached -
+    callers still get a fresh dict.
+    """
+    # Try to match by appid first (if it's a number)
+    try:
+        row = _APPID_ROW.get(int(key))
+    except ValueError:
+        # Otherwise look up the exact name
+        row = _NAME_ROW.get(key)
+    
+    if row is None:
+        # Try partial match on name
+        matches = np.flatnonzero(_name_matches(key))
+        if len(matches):
+            row = int(matches[0])
+    
+    if row is None and rf_process is not None and len(_name_lower):
+        # Last resort: best fuzzy match, so small typos still resolve
+        best = rf_process.extractOne(key, _name_lower, scorer=rf_fuzz.WRatio,
+                                     score_cutoff=FUZZY_MATCH_CUTOFF)
+        if best is not None:
+            row = int(best[2])
+    return row
+
+def _resolve_game_row(game_identifier: str) -> Optional[int]:
+    """Row position of the game matching an identifier, or None"""
+    # Normalize first so 'Portal 2', 'portal 2' and ' PORTAL 2 ' share one cache entry (tools also pass int appids)
+    return _resolve_key_row(str(game_identifier).strip().lower())
+
+def _resolve_game(game_identifier: str, columns: tuple = ('appid', 'name')) -> Optional[Dict[str, Any]]:
+    """
+    Resolve an identifier to just the columns a caller needs
+    
+    Wrapper tools only need the appid and name, so they skip building the full
+    get_game_details row. Resolution goes through the memoized _resolve_key_row.
+    
+    Args:
+        game_identifier: Game name or appid
+        columns: Columns to return
+        
+    Returns:
+        Dict of the requested columns, or None if no game matches
+    """
+    _wait_for_library()
+    if df.empty:
+        return None
+    row = _resolve_game_row(game_identifier)
+    if row is None:
+        return None
+    return _rows(df.iloc[row:row + 1][list(columns)])[0]
+
 @mcp.tool
 def get_game_details(
     game_identifier: Annotated[str, "Game name or appid to get details for"]
 ) -> Optional[Dict[str, Any]]:
     """Get comprehensive details about a specific game"""
+    _wait_for_library()
     if df.empty:
         return None
     
-    # Try to match by appid first (if it's a number)
-    try:
-        appid = int(game_identifier)
-        game = df[df['appid'] == appid]
-    except ValueError:
-        # Otherwise search by name (case-insensitive)
-        game = df[df['name'].str.lower() == game_identifier.lower()]
-    
-    if game.empty:
-        # Try partial match on name
-        game = df[df['name'].str.lower().str.contains(game_identifier.lower(), na=False)]
-    
-    if game.empty:
+    row = _resolve_game_row(game_identifier)
+    if row is None:
         return None
     
     # Return the first match
-    result = game.iloc[0].to_dict()
+    result = _rows(df.iloc[row:row + 1])[0]
     # Add the hours fields
     result['playtime_forever_hours'] = result['playtime_forever'] / 60
     result['playtime_2weeks_hours'] = result['playtime_2weeks'] / 60
@@ -873,142 +1697,97 @@ def get_game_reviews(
     game_identifier: Annotated[str, "Game name or appid to get review data for"]
 ) -> Optional[Dict[str, Any]]:
     """Get detailed review statistics for a game"""
-    game = get_game_details(game_identifier)
-    if not game:
-        return None
-    
-    return {
-        'name': game['name'],
-        'appid': game['appid'],
-        'review_summary': game['review_summary'],
-        'review_score': game['review_score'],
-        'total_reviews': game['total_reviews'],
-        'positive_reviews': game['positive_reviews'],
-        'negative_reviews': game['negative_reviews'],
-        'positive_percentage': (game['positive_reviews'] / game['total_reviews'] * 100) if game['total_reviews'] > 0 else 0
-    }
+    # Column order here is the response's key order
+    return _resolve_game(game_identifier, (
+        'name', 'appid', 'review_summary', 'review_score', 'total_reviews',
+        'positive_reviews', 'negative_reviews', 'positive_percentage'  # Derived once at load
+    ))
 
 @mcp.tool
 def get_library_stats() -> Dict[str, Any]:
     """Get overview statistics about the entire game library"""
-    if df.empty:
-        return {
-            'total_games': 0,
-            'total_hours_played': 0,
-            'average_hours_per_game': 0,
-            'top_genres': {},
-            'top_developers': {},
-            'review_distribution': {}
-        }
-    
-    # Basic stats
-    total_games = len(df)
-    total_hours = df['playtime_forever_hours'].sum()
-    avg_hours = total_hours / total_games if total_games > 0 else 0
-    
-    # Genre distribution (split comma-separated genres)
-    genre_counts = {}
-    for genres in df['genres'].dropna():
-        for genre in genres.split(', '):
-            genre = genre.strip()
-            genre_counts[genre] = genre_counts.get(genre, 0) + 1
-    top_genres = dict(sorted(genre_counts.items(), key=lambda x: x[1], reverse=True)[:10])
-    
-    # Developer distribution
-    dev_counts = df['developers'].value_counts().head(10).to_dict()
-    
-    # Review distribution
-    review_dist = df['review_summary'].value_counts().to_dict()
-    
-    return {
-        'total_games': total_games,
-        'total_hours_played': round(total_hours, 2),
-        'average_hours_per_game': round(avg_hours, 2),
-        'top_genres': top_genres,
-        'top_developers': dev_counts,
-        'review_distribution': review_dist
-    }
+    _wait_for_library()
+    # The library never changes after load, so the stats are computed once by the loader
+    return dict(_LIBRARY_STATS)
 
 @mcp.tool
 def get_recently_played() -> List[Dict[str, Any]]:
     """Get games played in the last 2 weeks"""
+    _wait_for_library()
     if df.empty:
         return []
     
-    recent = df[df['playtime_2weeks'] > 0].copy()
-    recent = recent.sort_values('playtime_2weeks', ascending=False)
+    # Games with 2-week playtime are exactly the head of the precomputed ranking
+    recent = df.iloc[_TOP_2W_IDX[:_RECENT_COUNT]]
     
-    results = recent[['appid', 'name', 'playtime_2weeks_hours', 'playtime_forever_hours']].to_dict('records')
+    results = _rows(recent[['appid', 'name', 'playtime_2weeks_hours', 'playtime_forever_hours']])
     return results
 
 @mcp.tool
 def get_recommendations() -> List[Dict[str, Any]]:
     """Get personalized game recommendations based on playtime patterns"""
+    _wait_for_library()
     if df.empty:
         return []
     
     recommendations = []
+    seen = set()  # appids already recommended - duplicates are skipped as they are generated
+    max_recommendations = 10
+    
+    def add(games: pd.DataFrame, reason: str) -> bool:
+        """Append unseen games with reason; True once the list is full"""
+        for game in _rows(games):
+            if game['appid'] in seen:
+                continue
+            seen.add(game['appid'])
+            recommendations.append({'appid': game['appid'], 'name': game['name'], 'reason': reason})
+            if len(recommendations) >= max_recommendations:
+                return True
+        return False
     
-    # Get user's top genres by playtime
-    played_games = df[df['playtime_forever'] > 0].copy()
+    # Get user's top genres by playtime (only the columns used below are materialized)
+    played_mask = (df['playtime_forever'] > 0).to_numpy(dtype=bool)
+    played_games = df.loc[played_mask, ['genres', 'developers', 'playtime_forever_hours']]
     if played_games.empty:
         # If no games played, recommend highest rated games
-        top_rated = df[df['review_summary'].isin(['Overwhelmingly Positive', 'Very Positive'])].head(5)
-        for _, game in top_rated.iterrows():
-            recommendations.append({
+        top_rated = df.loc[_HIGHLY_RATED, ['appid', 'name', 'review_summary']].head(5)
+        return [
+            {
                 'appid': game['appid'],
                 'name': game['name'],
                 'reason': f"Highly rated game ({game['review_summary']}) you haven't played yet"
-            })
-        return recommendations
-    
-    # Find favorite genres
-    genre_playtime = {}
-    for _, game in played_games.iterrows():
-        if pd.notna(game['genres']):
-            playtime = game['playtime_forever_hours']
-            for genre in game['genres'].split(', '):
-                genre = genre.strip()
-                genre_playtime[genre] = genre_playtime.get(genre, 0) + playtime
+            }
+            for game in _rows(top_rated)
+        ]
     
-    top_genres = sorted(genre_playtime.items(), key=lambda x: x[1], reverse=True)[:3]
+    # Find favorite genres: one row per (game, genre), summed per genre in pandas
+    genre_rows = played_games.dropna(subset=['genres'])
+    genre_rows = genre_rows.assign(genre=genre_rows['genres'].astype(str).str.split(', ')).explode('genre')
+    # sort=False + stable sort keeps first-seen order for ties, as the old dict-based loop did
+    genre_playtime = genre_rows.groupby(genre_rows['genre'].str.strip(), sort=False)['playtime_forever_hours'].sum()
+    top_genres = list(genre_playtime.sort_values(ascending=False, kind='stable').head(3).items())
     
     # Find unplayed games in favorite genres
-    unplayed = df[df['playtime_forever'] == 0].copy()
+    unplayed_mask = (df['playtime_forever'] == 0).to_numpy(dtype=bool)
+    # Highest rated unplayed games that carry the genre, from the prebuilt genre index
+    wanted = unplayed_mask & _HIGHLY_RATED
     
     for genre, hours in top_genres:
-        genre_games = unplayed[unplayed['genres'].str.contains(genre, na=False)]
-        # Get highest rated games in this genre
-        genre_games = genre_games[genre_games['review_summary'].isin(['Overwhelmingly Positive', 'Very Positive'])]
-        
-        for _, game in genre_games.head(2).iterrows():
-            recommendations.append({
-                'appid': game['appid'],
-                'name': game['name'],
-                'reason': f"Similar genre ({genre}) to games you've played {round(hours, 1)} hours"
-            })
+        rows = _GENRE_INDEX.get(genre, np.array([], dtype=np.intp))
+        genre_games = df.iloc[rows[wanted[rows]][:2]][['appid', 'name']]
+        if add(genre_games, f"Similar genre ({genre}) to games you've played {round(hours, 1)} hours"):
+            return recommendations
     
     # Find games from favorite developers
-    top_devs = played_games.groupby('developers')['playtime_forever_hours'].sum().sort_values(ascending=False).head(3)
+    top_devs = played_games.groupby('developers', observed=True)['playtime_forever_hours'].sum().sort_values(ascending=False).head(3)
+    unplayed = df.loc[unplayed_mask, ['appid', 'name', 'developers']]
     
     for dev, hours in top_devs.items():
-        dev_games = unplayed[unplayed['developers'] == dev]
-        for _, game in dev_games.head(1).iterrows():
-            recommendations.append({
-                'appid': game['appid'],
-                'name': game['name'],
-                'reason': f"From {dev} who made games you've played {round(hours, 1)} hours"
-            })
-    
-    # Remove duplicates
-    seen = set()
-    unique_recs = []
-    for rec in recommendations:
-        if rec['appid'] not in seen:
-            seen.add(rec['appid'])
-            unique_recs.append(rec)
+        dev_games = unplayed.loc[unplayed['developers'] == dev, ['appid', 'name']].head(1)
+        if add(dev_games, f"From {dev} who made games you've played {round(hours, 1)} hours"):
+            break
     
-    return unique_recs[:10]  # Limit to 10 recommendations
+    return recommendations
 
 @mcp.tool
 def get_game_achievements(
@@ -1018,8 +1797,8 @@ def get_game_achievements(
     if not STEAM_API_KEY or not STEAM_ID:
         return {"error": "Steam API credentials not configured"}
     
-    # Get the game details to find the appid
-    game = get_game_details(game_identifier)
+    # Resolve the game to find the appid
+    game = _resolve_game(game_identifier)
     if not game:
         return {"error": f"Game '{game_identifier}' not found in library"}
     
@@ -1064,21 +1843,22 @@ def get_game_achievements(
     if (progress_data and 'playerstats' in progress_data and 
         progress_data['playerstats'].get('success') and 
         'achievements' in progress_data['playerstats']):
-        player_achievements = {a['apiname']: a for a in progress_data['playerstats']['achievements']}
+        # apiname -> (unlocked, unlock timestamp), resolved once per player achievement
+        player_achievements = {
+            a['apiname']: (a.get('achieved', 0) == 1, a.get('unlocktime', 0))
+            for a in progress_data['playerstats']['achievements']
+        }
+        not_unlocked = (False, 0)
         
         for ach in all_achievements:
-            apiname = ach.get('name', '')
-            player_ach = player_achievements.get(apiname, {})
-            
-            unlocked = player_ach.get('achieved', 0) == 1
-            if unlocked:
-                unlocked_count += 1
+            unlocked, unlock_ts = player_achievements.get(ach.get('name', ''), not_unlocked)
+            unlocked_count += unlocked
             
             achievements.append({
                 'name': ach.get('displayName', 'Unknown'),
                 'description': ach.get('description', ''),
                 'unlocked': unlocked,
-                'unlock_time': datetime.fromtimestamp(player_ach.get('unlocktime', 0)).strftime('%Y-%m-%d %H:%M:%S') if player_ach.get('unlocktime', 0) > 0 else None
+                'unlock_time': datetime.fromtimestamp(unlock_ts).strftime('%Y-%m-%d %H:%M:%S') if unlock_ts > 0 else None
             })
     else:
         # No progress data, just return the achievement list
@@ -1105,15 +1885,13 @@ def get_game_achievements(
 @mcp.tool
 def get_achievement_stats() -> Dict[str, Any]:
     """Get overall achievement statistics across your library"""
+    _wait_for_library()
     if df.empty:
         return {'error': 'No library data loaded'}
     
     if not STEAM_API_KEY or not STEAM_ID:
         return {"error": "Steam API credentials not configured"}
     
-    # Get achievement data for games you've played
-    played_games = df[df['playtime_forever'] > 0].copy()
-    
     total_games_checked = 0
     games_with_achievements = 0
     total_achievements = 0
@@ -1123,11 +1901,13 @@ def get_achievement_stats() -> Dict[str, Any]:
     in_progress = []  # Games with some achievements
     
     # Limit to top 20 most played games to avoid long processing time
-    top_games = played_games.nsmallest(20, 'playtime_forever_hours')
+    # (a slice of the precomputed playtime ranking, keeping only games actually played)
+    top_games = top_n_by_playtime(20)
+    top_games = top_games[top_games['playtime_forever'] > 0]
     
-    for _, game in top_games.iterrows():
-        appid = game['appid']
-        
+    # Requests stay sequential: they all draw on the global rate limiter (0.5 req/s), so a
+    # concurrent batch would only drain the burst and fail the rest with rate-limit errors
+    for appid, name in zip(top_games['appid'].tolist(), top_games['name'].tolist()):
         # Get achievement schema
         schema_url = "http://api.steampowered.com/ISteamUserStats/GetSchemaForGame/v2/"
         schema_params = {'key': STEAM_API_KEY, 'appid': appid}
@@ -1157,7 +1937,7 @@ def get_achievement_stats() -> Dict[str, Any]:
             completion = (unlocked / game_total * 100) if game_total > 0 else 0
             
             game_info = {
-                'name': game['name'],
+                'name': name,
                 'appid': appid,
                 'unlocked': unlocked,
                 'total': game_total,
@@ -1187,6 +1967,7 @@ def get_achievement_stats() -> Dict[str, Any]:
 @mcp.tool
 def find_easy_achievements() -> List[Dict[str, Any]]:
     """Find games in your library with easy achievements to unlock"""
+    _wait_for_library()
     if df.empty or not STEAM_API_KEY or not STEAM_ID:
         return []
     
@@ -1195,13 +1976,12 @@ def find_easy_achievements() -> List[Dict[str, Any]]:
     
     easy_achievement_games = []
     
-    for _, game in games_to_check.iterrows():
-        appid = game['appid']
-        
+    # One request at a time - the calls share the global rate limiter (see get_achievement_stats)
+    schema_url = "http://api.steampowered.com/ISteamUserStats/GetSchemaForGame/v2/"
+    for appid, name, playtime_hours in zip(games_to_check['appid'].tolist(), games_to_check['name'].tolist(),
+                                           games_to_check['playtime_forever_hours'].tolist()):
         # Get achievement data
-        schema_url = "http://api.steampowered.com/ISteamUserStats/GetSchemaForGame/v2/"
-        schema_params = {'key': STEAM_API_KEY, 'appid': appid}
-        schema_data = call_steam_api(schema_url, schema_params)
+        schema_data = call_steam_api(schema_url, {'key': STEAM_API_KEY, 'appid': appid})
         
         if not schema_data or 'game' not in schema_data:
             continue
@@ -1215,15 +1995,66 @@ def find_easy_achievements() -> List[Dict[str, Any]]:
         # Games with few achievements are often easier to complete
         if total_achievements > 0 and total_achievements <= 20:
             easy_achievement_games.append({
-                'name': game['name'],
+                'name': name,
                 'appid': appid,
                 'total_achievements': total_achievements,
-                'playtime_hours': game['playtime_forever_hours'],
+                'playtime_hours': playtime_hours,
                 'reason': f'Only {total_achievements} achievements - potentially quick completion'
             })
     
     return sorted(easy_achievement_games, key=lambda x: x['total_achievements'])[:10]
 
+def _truncate(text: str, limit: int = 500) -> str:
+    """Cut text to limit characters, marking the cut with '...'"""
+    return text if len(text) <= limit else text[:limit] + '...'
+
+def _fetch_published_file_details(file_ids: List[str], timeout=HTTP_TIMEOUT) -> List[Dict[str, Any]]:
+    """
+    Fetch GetPublishedFileDetails for several files in one request
+    
+    The endpoint accepts an item list (publishedfileids[0..n]), so N guides cost
+    one round trip instead of N. Details are kept in guide_cache per file, so only
+    files not seen recently are requested.
+    
+    Args:
+        file_ids: Published file (guide) IDs
+        timeout: requests timeout for the POST
+        
+    Returns:
+        Detail dicts in request order (empty list on a non-200 response);
+        network errors propagate to the caller
+    """
+    if not file_ids:
+        return []
+    cached = {file_id: guide_cache.get(f"details:{file_id}") for file_id in file_ids}
+    missing = [file_id for file_id, details in cached.items() if details is None]
+    
+    if missing:
+        api_url = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
+        api_data = {'itemcount': len(missing)}
+        for i, file_id in enumerate(missing):
+            api_data[f'publishedfileids[{i}]'] = file_id
+        
+        if STEAM_API_KEY:
+            api_data['key'] = STEAM_API_KEY
+        
+        response = http_session.post(api_url, data=api_data, timeout=timeout)
+        if response.status_code != 200:
+            return []
+        fetched = _response_json(response).get('response', {}).get('publishedfiledetails', [])
+        for file_id, details in zip(missing, fetched):
+            guide_cache.set(f"details:{file_id}", details)
+            cached[file_id] = details
+    
+    # Stop at the first file the API returned nothing for, like a short API response
+    results = []
+    for file_id in file_ids:
+        details = cached.get(file_id)
+        if details is None:
+            break
+        results.append(details)
+    return results
+
 @mcp.tool
 def search_game_guides(
     game_identifier: Annotated[str, "Game name or appid to search guides for"],
@@ -1231,8 +2062,8 @@ def search_game_guides(
     limit: Annotated[int, "Number of guides to return (default 10)"] = 10
 ) -> Dict[str, Any]:
     """Search for community guides for a specific game"""
-    # Get the game details to find the appid
-    game = get_game_details(game_identifier)
+    # Resolve the game to find the appid
+    game = _resolve_game(game_identifier)
     if not game:
         return {"error": f"Game '{game_identifier}' not found in library"}
     
@@ -1242,16 +2073,15 @@ def search_game_guides(
     url = f"https://steamcommunity.com/app/{appid}/guides/?browsefilter=toprated&browsesort=toprated"
     
     try:
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }, timeout=10)
+        response = http_session.get(url, timeout=HTTP_TIMEOUT)
         
         if response.status_code != 200:
             return {"error": f"Failed to fetch guides page: HTTP {response.status_code}"}
         
         # Extract guide IDs from the page
-        guide_ids = re.findall(r'sharedfiles/filedetails/\?id=(\d+)', response.text)
-        unique_guide_ids = list(set(guide_ids))[:limit * 2]  # Get extra in case of filtering
+        guide_ids = _RE_GUIDE_ID.findall(response.text)
+        # Order-preserving dedup keeps the page's top-rated ranking
+        unique_guide_ids = list(dict.fromkeys(guide_ids))[:limit * 2]  # Get extra in case of filtering
         
         if not unique_guide_ids:
             return {
@@ -1262,46 +2092,29 @@ def search_game_guides(
                 'message': 'No guides found for this game'
             }
         
-        # Fetch details for each guide using the API
+        # Fetch details for all candidate guides in one batched API request
         guides = []
-        for guide_id in unique_guide_ids[:limit]:
-            api_url = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
-            api_data = {
-                'itemcount': 1,
-                'publishedfileids[0]': guide_id
-            }
+        details = _fetch_published_file_details(unique_guide_ids, timeout=(HTTP_CONNECT_TIMEOUT, 5))
+        for guide_id, guide_info in zip(unique_guide_ids, details):
+            # Extract tags
+            tags = [t.get('tag', '') for t in guide_info.get('tags', [])]
             
-            if STEAM_API_KEY:
-                api_data['key'] = STEAM_API_KEY
-            
-            try:
-                api_response = requests.post(api_url, data=api_data, timeout=5)
-                if api_response.status_code == 200:
-                    guide_data = api_response.json()
-                    if 'response' in guide_data and 'publishedfiledetails' in guide_data['response']:
-                        guide_info = guide_data['response']['publishedfiledetails'][0]
-                        
-                        # Extract tags
-                        tags = [t.get('tag', '') for t in guide_info.get('tags', [])]
-                        
-                        # Filter by category if specified
-                        if category and category.lower() not in [t.lower() for t in tags]:
-                            continue
-                        
-                        guides.append({
-                            'id': guide_id,
-                            'title': guide_info.get('title', 'Untitled'),
-                            'description': guide_info.get('description', '')[:500] + '...' if len(guide_info.get('description', '')) > 500 else guide_info.get('description', ''),
-                            'tags': tags,
-                            'views': guide_info.get('views', 0),
-                            'favorites': guide_info.get('favorited', 0),
-                            'url': f"https://steamcommunity.com/sharedfiles/filedetails/?id={guide_id}"
-                        })
-                        
-                        if len(guides) >= limit:
-                            break
-            except Exception:
+            # Filter by category if specified
+            if category and category.lower() not in [t.lower() for t in tags]:
                 continue
+            
+            guides.append({
+                'id': guide_id,
+                'title': guide_info.get('title', 'Untitled'),
+                'description': _truncate(guide_info.get('description', '')),
+                'tags': tags,
+                'views': guide_info.get('views', 0),
+                'favorites': guide_info.get('favorited', 0),
+                'url': f"https://steamcommunity.com/sharedfiles/filedetails/?id={guide_id}"
+            })
+            
+            if len(guides) >= limit:
+                break
         
         return {
             'game': game['name'],
@@ -1318,34 +2131,24 @@ def get_guide_content(
     guide_id: Annotated[str, "Steam Community guide ID"]
 ) -> Optional[Dict[str, Any]]:
     """Get full content of a specific Steam Community guide"""
-    api_url = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
-    api_data = {
-        'itemcount': 1,
-        'publishedfileids[0]': guide_id
-    }
-    
-    if STEAM_API_KEY:
-        api_data['key'] = STEAM_API_KEY
-    
     try:
-        response = requests.post(api_url, data=api_data, timeout=10)
-        if response.status_code == 200:
-            guide_data = response.json()
-            if 'response' in guide_data and 'publishedfiledetails' in guide_data['response']:
-                guide = guide_data['response']['publishedfiledetails'][0]
-                
-                return {
-                    'id': guide_id,
-                    'title': guide.get('title', 'Untitled'),
-                    'description': guide.get('description', ''),
-                    'tags': [t.get('tag', '') for t in guide.get('tags', [])],
-                    'views': guide.get('views', 0),
-                    'favorites': guide.get('favorited', 0),
-                    'subscriptions': guide.get('subscriptions', 0),
-                    'created': datetime.fromtimestamp(guide.get('time_created', 0)).strftime('%Y-%m-%d') if guide.get('time_created') else None,
-                    'updated': datetime.fromtimestamp(guide.get('time_updated', 0)).strftime('%Y-%m-%d') if guide.get('time_updated') else None,
-                    'url': f"https://steamcommunity.com/sharedfiles/filedetails/?id={guide_id}"
-                }
+        # Single-item case of the batched details request
+        details = _fetch_published_file_details([guide_id])
+        if details:
+            guide = details[0]
+            
+            return {
+                'id': guide_id,
+                'title': guide.get('title', 'Untitled'),
+                'description': guide.get('description', ''),
+                'tags': [t.get('tag', '') for t in guide.get('tags', [])],
+                'views': guide.get('views', 0),
+                'favorites': guide.get('favorited', 0),
+                'subscriptions': guide.get('subscriptions', 0),
+                'created': datetime.fromtimestamp(guide.get('time_created', 0)).strftime('%Y-%m-%d') if guide.get('time_created') else None,
+                'updated': datetime.fromtimestamp(guide.get('time_updated', 0)).strftime('%Y-%m-%d') if guide.get('time_updated') else None,
+                'url': f"https://steamcommunity.com/sharedfiles/filedetails/?id={guide_id}"
+            }
     except Exception as e:
         return {"error": f"Failed to fetch guide: {str(e)}"}
     
@@ -1364,7 +2167,7 @@ def get_game_news(
     count: Annotated[int, "Number of news items to return (default 5)"] = 5
 ) -> Dict[str, Any]:
     """Get latest news, updates, and patch notes for a game"""
-    game = get_game_details(game_identifier)
+    game = _resolve_game(game_identifier)
     if not game:
         return {"error": f"Game '{game_identifier}' not found in library"}
     
@@ -1388,7 +2191,7 @@ def get_game_news(
     for item in data['appnews']['newsitems']:
         news_items.append({
             'title': item.get('title', 'Untitled'),
-            'content': item.get('contents', '')[:500] + '...' if len(item.get('contents', '')) > 500 else item.get('contents', ''),
+            'content': _truncate(item.get('contents', '')),
             'author': item.get('author', 'Unknown'),
             'date': datetime.fromtimestamp(item.get('date', 0)).strftime('%Y-%m-%d') if item.get('date') else None,
             'url': item.get('url', '')
@@ -1401,12 +2204,16 @@ def get_game_news(
         'news': news_items
     }
 
+# Global unlock percentage bins: < 5 Very Rare, < 20 Rare, < 50 Uncommon, else Common
+RARITY_EDGES = np.array([5.0, 20.0, 50.0])
+RARITY_LABELS = ('Very Rare', 'Rare', 'Uncommon', 'Common')
+
 @mcp.tool
 def get_global_achievement_stats(
     game_identifier: Annotated[str, "Game name or appid to get achievement stats for"]
 ) -> Dict[str, Any]:
     """Get global achievement statistics showing how rare each achievement is"""
-    game = get_game_details(game_identifier)
+    game = _resolve_game(game_identifier)
     if not game:
         return {"error": f"Game '{game_identifier}' not found in library"}
     
@@ -1440,21 +2247,23 @@ def get_global_achievement_stats(
                 for a in player_data['playerstats']['achievements']
             }
     
-    # Combine global stats with player data
+    # Classify all percentages at once: bin edge index -> rarity label
+    percents = np.fromiter((float(ach['percent']) for ach in achievements), dtype=np.float64, count=len(achievements))
+    tiers = np.searchsorted(RARITY_EDGES, percents, side='right')
+    
+    # Combine global stats with player data, rarest first (stable, like list.sort)
     achievement_stats = []
-    for ach in achievements:
+    for i in np.argsort(percents, kind='stable').tolist():
+        name = achievements[i]['name']
         stat = {
-            'name': ach['name'],
-            'percent': float(ach['percent']),
-            'rarity': 'Very Rare' if float(ach['percent']) < 5 else 'Rare' if float(ach['percent']) < 20 else 'Uncommon' if float(ach['percent']) < 50 else 'Common'
+            'name': name,
+            'percent': float(percents[i]),
+            'rarity': RARITY_LABELS[tiers[i]]
         }
-        if ach['name'] in player_achievements:
-            stat['unlocked'] = player_achievements[ach['name']]
+        if name in player_achievements:
+            stat['unlocked'] = player_achievements[name]
         achievement_stats.append(stat)
     
-    # Sort by rarity (rarest first)
-    achievement_stats.sort(key=lambda x: x['percent'])
-    
     return {
         'game': game['name'],
         'appid': appid,
@@ -1509,7 +2318,7 @@ def get_friends_activity() -> Dict[str, Any]:
                 activity['current_game'] = player['gameextrainfo']
                 activity['status'] = 'In-Game'
             
-            # Get recently played games
+            # Get recently played games (sequential - the requests share the global rate limiter)
             recent_url = f"https://api.steampowered.com/IPlayerService/GetRecentlyPlayedGames/v1/"
             recent_params = {
                 'key': STEAM_API_KEY,
@@ -1545,7 +2354,7 @@ def get_player_profile(
     # If URL provided, extract Steam ID
     if 'steamcommunity.com' in steam_id:
         # Try to extract ID from URL
-        match = re.search(r'steamcommunity\.com/id/([^/]+)', steam_id)
+        match = _RE_VANITY_URL.search(steam_id)
         if match:
             vanity_url = match.group(1)
             # Resolve vanity URL
@@ -1583,6 +2392,8 @@ def get_player_profile(
         'current_game': player.get('gameextrainfo', None)
     }
 
+NUMPY_INTERSECT_MIN = 2000  # Smaller library size at which a sorted merge beats per-key hashing
+
 @mcp.tool
 def compare_games_with_friend(
     friend_steam_id: Annotated[str, "Friend's Steam ID to compare libraries with"]
@@ -1591,54 +2402,87 @@ def compare_games_with_friend(
     if not STEAM_API_KEY or not STEAM_ID:
         return {"error": "Steam API credentials not configured"}
     
-    # Get your games
+    # Fetch both libraries concurrently
     your_games_url = f"https://api.steampowered.com/IPlayerService/GetOwnedGames/v1/"
     your_params = {
         'key': STEAM_API_KEY,
         'steamid': STEAM_ID,
         'include_appinfo': 1
     }
-    
-    your_data = call_steam_api(your_games_url, your_params)
-    if not your_data or 'response' not in your_data:
-        return {"error": "Unable to fetch your library"}
-    
-    your_games = {g['appid']: g for g in your_data['response'].get('games', [])}
-    
-    # Get friend's games
     friend_params = {
         'key': STEAM_API_KEY,
         'steamid': friend_steam_id,
         'include_appinfo': 1
     }
     
-    friend_data = call_steam_api(your_games_url, friend_params)
+    libraries = executor.execute_parallel([
+        ('yours', call_steam_api, (your_games_url, your_params), {}),
+        ('friend', call_steam_api, (your_games_url, friend_params), {})
+    ])
+    
+    your_data = libraries['yours']
+    if not your_data or 'response' not in your_data:
+        return {"error": "Unable to fetch your library"}
+    
+    your_games = {g['appid']: g for g in your_data['response'].get('games', [])}
+    
+    friend_data = libraries['friend']
     if not friend_data or 'response' not in friend_data:
         return {"error": "Unable to fetch friend's library (may be private)"}
     
     friend_games = {g['appid']: g for g in friend_data['response'].get('games', [])}
     
-    # Find common games
-    common_appids = set(your_games.keys()) & set(friend_games.keys())
+    # Nothing can be in common with an empty library
+    if not your_games or not friend_games:
+        return {
+            'your_total_games': len(your_games),
+            'friend_total_games': len(friend_games),
+            'common_games_count': 0,
+            'common_games': []
+        }
     
-    common_games = []
-    for appid in common_appids:
-        game = your_games[appid]
-        common_games.append({
-            'appid': appid,
+    # Find common games by walking the smaller library; big libraries use a sorted merge in C instead
+    yours_is_smaller = len(your_games) <= len(friend_games)
+    small, large = (your_games, friend_games) if yours_is_smaller else (friend_games, your_games)
+    
+    if len(small) >= NUMPY_INTERSECT_MIN:
+        common = np.intersect1d(
+            np.fromiter(small, dtype=np.int64, count=len(small)),
+            np.fromiter(large, dtype=np.int64, count=len(large)),
+            assume_unique=True
+        ).tolist()
+        matches = [(small[appid], large[appid]) for appid in common]
+    else:
+        matches = []
+        for appid, entry in small.items():
+            other = large.get(appid)
+            if other is not None:
+                matches.append((entry, other))
+    
+    # Playtimes for all matches converted to hours in one vectorized pass
+    yours, theirs = (0, 1) if yours_is_smaller else (1, 0)
+    your_hours = np.fromiter((pair[yours].get('playtime_forever', 0) for pair in matches),
+                             dtype=np.float64, count=len(matches)) / 60
+    friend_hours = np.fromiter((pair[theirs].get('playtime_forever', 0) for pair in matches),
+                               dtype=np.float64, count=len(matches)) / 60
+    
+    # Top 20 by combined playtime; only those matches become output dicts
+    top = _top_k_indices(your_hours + friend_hours, 20)
+    top_games = []
+    for i, your_playtime, friend_playtime in zip(top.tolist(), your_hours[top].tolist(), friend_hours[top].tolist()):
+        game = matches[i][yours]
+        top_games.append({
+            'appid': game['appid'],
             'name': game.get('name', 'Unknown'),
-            'your_playtime': game.get('playtime_forever', 0) / 60,  # Convert to hours
-            'friend_playtime': friend_games[appid].get('playtime_forever', 0) / 60
+            'your_playtime': your_playtime,
+            'friend_playtime': friend_playtime
         })
     
-    # Sort by combined playtime
-    common_games.sort(key=lambda x: x['your_playtime'] + x['friend_playtime'], reverse=True)
-    
     return {
         'your_total_games': len(your_games),
         'friend_total_games': len(friend_games),
-        'common_games_count': len(common_games),
-        'common_games': common_games[:20]  # Top 20
+        'common_games_count': len(matches),
+        'common_games': top_games
     }
 
 @mcp.tool
@@ -1646,7 +2490,7 @@ def get_game_player_count(
     game_identifier: Annotated[str, "Game name or appid to get player count for"]
 ) -> Dict[str, Any]:
     """Get the current number of players in a game"""
-    game = get_game_details(game_identifier)
+    game = _resolve_game(game_identifier)
     if not game:
         return {"error": f"Game '{game_identifier}' not found in library"}
     
@@ -1665,36 +2509,39 @@ def get_game_player_count(
         'game': game['name'],
         'appid': appid,
         'current_players': player_count,
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        'timestamp': strftime('%Y-%m-%d %H:%M:%S', localtime())
     }
 
+@mcp.tool
+def get_game_player_counts(
+    game_identifiers: Annotated[List[str], "Game names or appids to get player counts for"]
+) -> List[Dict[str, Any]]:
+    """Get the current number of players for several games at once"""
+    # Looked up one at a time: uncached lookups share the global rate limiter, and a concurrent
+    # batch would drain its burst and fail the rest instead of waiting for tokens
+    return [get_game_player_count(identifier) for identifier in game_identifiers]
+
 @mcp.tool
 def get_steam_level_progress() -> Dict[str, Any]:
     """Get your Steam level, badge progress, and XP information"""
     if not STEAM_API_KEY or not STEAM_ID:
         return {"error": "Steam API credentials not configured"}
     
-    # Get Steam level
+    # Steam level and badges are independent requests - fetch them concurrently
     level_url = f"https://api.steampowered.com/IPlayerService/GetSteamLevel/v1/"
-    level_params = {
-        'key': STEAM_API_KEY,
-        'steamid': STEAM_ID
-    }
+    badges_url = f"https://api.steampowered.com/IPlayerService/GetBadges/v1/"
+    fetched = executor.execute_parallel([
+        ('level', call_steam_api, (level_url, _AUTH_PARAMS), {}),
+        ('badges', call_steam_api, (badges_url, _AUTH_PARAMS), {})
+    ])
     
-    level_data = call_steam_api(level_url, level_params)
+    level_data = fetched['level']
     if not level_data or 'response' not in level_data:
         return {"error": "Unable to fetch Steam level"}
     
     level = level_data['response'].get('player_level', 0)
     
-    # Get badges
-    badges_url = f"https://api.steampowered.com/IPlayerService/GetBadges/v1/"
-    badges_params = {
-        'key': STEAM_API_KEY,
-        'steamid': STEAM_ID
-    }
-    
-    badges_data = call_steam_api(badges_url, badges_params)
+    badges_data = fetched['badges']
     if not badges_data or 'response' not in badges_data:
         return {"error": "Unable to fetch badge data"}
     
@@ -1707,18 +2554,40 @@ def get_steam_level_progress() -> Dict[str, Any]:
     player_xp_needed_current_level = badges_response.get('player_xp_needed_current_level', 0)
     player_xp_needed_to_level_up = badges_response.get('player_xp_needed_to_level_up', 0)
     
-    # Sort badges by XP earned
-    badge_list = []
+    # Badges that earned XP go into parallel arrays; dicts are only built for the top 10
+    appids = np.empty(len(badges), dtype=np.int64)
+    levels = np.empty(len(badges), dtype=np.int64)
+    xps = np.empty(len(badges), dtype=np.int64)
+    completion_times = np.empty(len(badges), dtype=np.int64)
+    n = 0
+    _get = dict.get
     for badge in badges:
-        if badge.get('xp', 0) > 0:
-            badge_list.append({
-                'appid': badge.get('appid', 0),
-                'level': badge.get('level', 0),
-                'xp': badge.get('xp', 0),
-                'completion_time': datetime.fromtimestamp(badge.get('completion_time', 0)).strftime('%Y-%m-%d') if badge.get('completion_time') else None
-            })
-    
-    badge_list.sort(key=lambda x: x['xp'], reverse=True)
+        xp = _get(badge, 'xp', 0)
+        if xp <= 0:
+            continue
+        # GetBadges always sends level and completion_time; only community badges lack an appid
+        try:
+            levels[n] = badge['level']
+            completion_times[n] = badge['completion_time'] or 0
+        except KeyError:
+            levels[n] = _get(badge, 'level', 0)
+            completion_times[n] = _get(badge, 'completion_time') or 0
+        appids[n] = _get(badge, 'appid', 0)
+        xps[n] = xp
+        n += 1
+    
+    top = _top_k_indices(xps[:n], 10)
+    top_badges = [
+        {
+            'appid': appid,
+            'level': badge_level,
+            'xp': xp,
+            'completion_time': strftime('%Y-%m-%d', localtime(ts)) if ts else None
+        }
+        for appid, badge_level, xp, ts in zip(
+            appids[top].tolist(), levels[top].tolist(), xps[top].tolist(), completion_times[top].tolist()
+        )
+    ]
     
     return {
         'steam_level': level,
@@ -1726,7 +2595,7 @@ def get_steam_level_progress() -> Dict[str, Any]:
         'xp_to_next_level': player_xp_needed_to_level_up,
         'xp_needed_for_current_level': player_xp_needed_current_level,
         'total_badges': len(badges),
-        'top_badges': badge_list[:10]
+        'top_badges': top_badges
     }
 
 # ============================================================================
@@ -1740,9 +2609,13 @@ def get_achievement_roadmap(
     sort_by: Annotated[str, "Sorting strategy: 'efficiency' (default), 'completion', 'missable', 'rarity'"] = "efficiency"
 ) -> Dict[str, Any]:
     """Generate intelligent achievement progression roadmap with prioritized suggestions"""
+    return _achievement_roadmap(game_identifier, get_game_achievements(game_identifier), sort_by)
+
+def _achievement_roadmap(game_identifier: str, achievement_data: Optional[Dict[str, Any]],
+                         sort_by: str = "efficiency") -> Dict[str, Any]:
+    """Roadmap body for achievement data the caller already fetched with get_game_achievements"""
     
-    # Step 1: Get base achievement data
-    achievement_data = get_game_achievements(game_identifier)
+    # Step 1: Check base achievement data
     if not achievement_data or 'error' in achievement_data:
         return achievement_data
     
@@ -1780,125 +2653,115 @@ def get_achievement_roadmap(
                 guide_title = guide.get('title', '').lower()
                 guide_map[guide_title] = guide.get('url', '')
     
+    # Split unlocked names from locked achievements in one pass
+    unlocked_names = set()
+    locked = []
+    for ach in achievements:
+        if ach.get('unlocked'):
+            unlocked_names.add(ach['name'])
+        else:
+            locked.append(ach)
+    
     # Step 3.5: PHASE 2.3 - Build dependency graph for optimal achievement ordering
     dependency_graph = dependency_detector.build_dependency_graph(achievements)
-    unlocked_names = {ach['name'] for ach in achievements if ach.get('unlocked')}
     optimal_order = dependency_detector.get_optimal_order(achievements, unlocked_names)
     
     # Create optimal order index for sorting
     optimal_order_map = {name: idx for idx, name in enumerate(optimal_order)}
     
-    # Step 4: Enrich and score each achievement
-    locked_achievements = []
-    for ach in achievements:
-        if ach.get('unlocked'):
-            continue  # Skip already unlocked
-        
+    # Lowercase each locked name once for guide matching
+    locked_names_lower = [ach['name'].lower() for ach in locked]
+    
+    # Guide URL for each locked achievement name, matched in one pass over the guide titles
+    guide_urls = _match_guide_titles(set(locked_names_lower), guide_map)
+    
+    # Step 4: Score each achievement; per-achievement fields stay in plain tuples and sort
+    # keys in parallel lists, so only the returned top 10 are ever built as dicts
+    entries = []
+    rarity_values, guide_flags, difficulty_codes = [], [], []
+    order_keys, difficulty_keys, rarity_keys = [], [], []
+    for ach, name_lower in zip(locked, locked_names_lower):
         # Get rarity (default to 50% if unknown)
         rarity = rarity_data.get(ach['name'], 50.0)
         
         # Check if guide exists
-        ach_name_lower = ach['name'].lower()
-        has_guide = any(ach_name_lower in title for title in guide_map.keys())
-        guide_url = None
-        for title, url in guide_map.items():
-            if ach_name_lower in title:
-                guide_url = url
-                break
+        guide_url = guide_urls.get(name_lower)
         
         # PHASE 2.3: ML-based difficulty prediction (replaces simple rarity-based estimation)
         difficulty_analysis = difficulty_predictor.predict_difficulty(ach, rarity)
         difficulty = difficulty_analysis['category']
-        difficulty_score = difficulty_analysis['score']
-        time_estimate = difficulty_analysis['estimated_time']
-        
-        # Calculate priority score
-        priority_score = _calculate_priority_score(
-            unlocked=False,
-            rarity=rarity,
-            has_guide=has_guide,
-            is_missable=False,  # Will be enhanced in scan_for_missable_content
-            difficulty=difficulty
-        )
         
         # PHASE 2.3: Add dependency information
         ach_name = ach['name']
-        dependencies = dependency_graph['edges'].get(ach_name, [])
-        dependency_level = None
-        for level_idx, level in enumerate(dependency_graph['levels']):
-            if ach_name in level:
-                dependency_level = level_idx
-                break
-        
-        enriched = {
-            'name': ach['name'],
+        order_index = optimal_order_map.get(ach_name, 999)
+        
+        entries.append((ach, rarity, guide_url, difficulty_analysis, order_index))
+        rarity_values.append(rarity)
+        guide_flags.append(guide_url is not None)
+        difficulty_codes.append(PRIORITY_DIFFICULTY_CODES.get(difficulty, 4))
+        order_keys.append(order_index)
+        difficulty_keys.append(round(difficulty_analysis['score'], 1))
+        rarity_keys.append(round(rarity, 1))
+    
+    # Calculate priority scores (is_missable will be enhanced in scan_for_missable_content)
+    scores = _calculate_priority_scores(
+        np.array(rarity_values, dtype=np.float64),
+        np.array(guide_flags, dtype=bool),
+        np.array(difficulty_codes, dtype=np.intp)
+    )
+    
+    # Step 5: Sort based on strategy (PHASE 2.3: Enhanced with dependency-aware sorting)
+    # One stable C-level lexsort over the key arrays; the last key is the primary one
+    priority_keys = [round(score, 3) for score in scores.tolist()]
+    priorities = np.array(priority_keys, dtype=np.float64)
+    order_indices = np.array(order_keys, dtype=np.int64)
+    difficulty_scores = np.array(difficulty_keys, dtype=np.float64)
+    rarities = np.array(rarity_keys, dtype=np.float64)
+    strategy_keys = {
+        # High priority score + optimal dependency order, then by difficulty
+        "efficiency": (difficulty_scores, order_indices, -priorities),
+        # Easiest first (high rarity = easy), respecting dependency order first
+        "completion": (difficulty_scores, -rarities, order_indices),
+        # Missable first (will need scan_for_missable_content enhancement)
+        "missable": (order_indices, -priorities),
+        # Rarest first (low rarity = rare), respecting dependency order first
+        "rarity": (rarities, order_indices)
+    }
+    keys = strategy_keys.get(sort_by)
+    order = np.lexsort(keys) if keys is not None else np.arange(len(entries))
+    
+    # Only the top 10 are returned, so only they are enriched into dicts, in ranked order
+    ranked = []
+    for i in order[:10].tolist():
+        ach, rarity, guide_url, difficulty_analysis, order_index = entries[i]
+        ach_name = ach['name']
+        ranked.append({
+            'name': ach_name,
             'description': ach.get('description', ''),
             'icon': ach.get('icon', ''),
             'unlocked': False,
-            'priority_score': round(priority_score, 3),
-            'rarity': round(rarity, 1),
-            'estimated_difficulty': difficulty,
-            'difficulty_score': round(difficulty_score, 1),
-            'has_guide': has_guide,
+            'priority_score': priority_keys[i],
+            'rarity': rarity_keys[i],
+            'estimated_difficulty': difficulty_analysis['category'],
+            'difficulty_score': difficulty_keys[i],
+            'has_guide': guide_flags[i],
             'guide_url': guide_url,
-            'time_estimate': time_estimate,
-            'dependencies': dependencies,
-            'dependency_level': dependency_level,
-            'optimal_order_index': optimal_order_map.get(ach_name, 999)
-        }
-        
-        locked_achievements.append(enriched)
-    
-    # Step 5: Sort based on strategy (PHASE 2.3: Enhanced with dependency-aware sorting)
-    if sort_by == "efficiency":
-        # High priority score + optimal dependency order
-        locked_achievements.sort(key=lambda x: (
-            -x['priority_score'],  # Higher priority first
-            x['optimal_order_index'],  # Then by dependency order
-            x['difficulty_score']  # Then by difficulty
-        ))
-    elif sort_by == "completion":
-        # Easiest first (high rarity = easy, respecting dependencies)
-        locked_achievements.sort(key=lambda x: (
-            x['optimal_order_index'],  # Respect dependency order first
-            -x['rarity'],  # Then easiest first
-            x['difficulty_score']
-        ))
-    elif sort_by == "missable":
-        # Missable first (will need scan_for_missable_content enhancement)
-        locked_achievements.sort(key=lambda x: (
-            -x['priority_score'],
-            x['optimal_order_index']
-        ))
-    elif sort_by == "rarity":
-        # Rarest first (low rarity = rare, respecting dependencies)
-        locked_achievements.sort(key=lambda x: (
-            x['optimal_order_index'],  # Respect dependency order first
-            x['rarity']  # Then rarest first
-        ))
+            'time_estimate': difficulty_analysis['estimated_time'],
+            'dependencies': dependency_graph['edges'].get(ach_name, []),
+            'dependency_level': dependency_graph['level_index'].get(ach_name),
+            'optimal_order_index': order_index
+        })
     
     # Step 6: Add actionable next steps to top achievements (PHASE 2.3: Enhanced with dependencies)
-    for i, ach in enumerate(locked_achievements[:5]):
-        next_steps = []
-        
-        # Check for dependencies
-        if ach['dependencies']:
-            unmet_deps = [dep for dep in ach['dependencies'] if dep not in unlocked_names]
-            if unmet_deps:
-                next_steps.append(f"⚠️ Prerequisites needed: {', '.join(unmet_deps[:3])}")
-        
-        # Add difficulty and time context
-        next_steps.append(f"Difficulty: {ach['estimated_difficulty']} ({ach['difficulty_score']}/100)")
-        next_steps.append(f"Estimated time: {ach['time_estimate']}")
-        
-        # Add guide if available
-        if ach['has_guide']:
-            next_steps.append(f"📘 Community guide available: {ach['guide_url']}")
-        
-        # Add description focus
-        next_steps.append(f"Focus: {ach['description']}")
-        
-        ach['next_steps'] = " | ".join(next_steps)
+    for ach in ranked[:5]:
+        # Prerequisites (if any unmet) and guide segments are optional; the rest always appear
+        unmet_deps = [dep for dep in ach['dependencies'] if dep not in unlocked_names]
+        prereq = f"⚠️ Prerequisites needed: {', '.join(unmet_deps[:3])} | " if unmet_deps else ""
+        guide = f"📘 Community guide available: {ach['guide_url']} | " if ach['has_guide'] else ""
+        ach['next_steps'] = (
+            f"{prereq}Difficulty: {ach['estimated_difficulty']} ({ach['difficulty_score']}/100) | "
+            f"Estimated time: {ach['time_estimate']} | {guide}Focus: {ach['description']}"
+        )
     
     completion_percentage = round((unlocked_count / total_count * 100), 1) if total_count > 0 else 0
     
@@ -1909,50 +2772,77 @@ def get_achievement_roadmap(
         'unlocked': unlocked_count,
         'completion_percentage': completion_percentage,
         'sort_strategy': sort_by,
-        'roadmap': locked_achievements[:10],  # Return top 10
-        'total_remaining': len(locked_achievements),
+        'roadmap': ranked,  # Return top 10
+        'total_remaining': len(entries),
         'dependency_analysis': {
             'total_dependency_levels': len(dependency_graph['levels']),
-            'achievements_with_dependencies': sum(1 for ach in locked_achievements if ach['dependencies']),
+            'achievements_with_dependencies': sum(1 for ach in locked if dependency_graph['edges'].get(ach['name'])),
             'optimal_order_available': True
         }
     }
 
-def _calculate_priority_score(unlocked: bool, rarity: float, has_guide: bool, 
-                              is_missable: bool, difficulty: str) -> float:
-    """Calculate priority score for achievement (0.0-1.0, higher = more priority)"""
-    
-    if unlocked:
-        return 0.0
-    
-    # Base score from rarity (invert: rarer = higher value)
-    rarity_score = 1.0 - (rarity / 100.0)
-    
-    # Missable achievements get huge boost
-    missable_multiplier = 3.0 if is_missable else 1.0
-    
-    # Guide availability reduces friction
-    guide_bonus = 0.2 if has_guide else 0.0
-    
-    # Difficulty scoring (prefer easier achievements)
-    difficulty_map = {
-        "easy": 1.0,
-        "medium": 0.7,
-        "hard": 0.4,
-        "very_hard": 0.2
-    }
-    difficulty_score = difficulty_map.get(difficulty, 0.5)
+# Difficulty category codes and their priority weights (prefer easier achievements); unknown -> 0.5
+PRIORITY_DIFFICULTY_CODES = {"easy": 0, "medium": 1, "hard": 2, "very_hard": 3}
+PRIORITY_DIFFICULTY_SCORES = np.array([1.0, 0.7, 0.4, 0.2, 0.5])
+
+def _calculate_priority_scores(rarity: np.ndarray, has_guide: np.ndarray, difficulty_codes: np.ndarray,
+                               is_missable: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Calculate priority scores for locked achievements (0.0-1.0, higher = more priority)
     
-    # Combined formula
+    Args:
+        rarity: Global unlock percentages
+        has_guide: Whether a community guide covers each achievement
+        difficulty_codes: Indices into PRIORITY_DIFFICULTY_SCORES
+        is_missable: Optional missable flags (missable achievements get a 3x boost)
+        
+    Returns:
+        Array of scores, one per achievement
+    """
     score = (
-        rarity_score * 0.3 +      # Rarity weight: 30%
-        difficulty_score * 0.4 +   # Difficulty weight: 40%
-        guide_bonus * 0.3          # Guide bonus: 30%
+        (1.0 - rarity / 100.0) * 0.3 +                         # Rarity weight: 30% (rarer = higher)
+        PRIORITY_DIFFICULTY_SCORES[difficulty_codes] * 0.4 +  # Difficulty weight: 40%
+        np.where(has_guide, 0.2, 0.0) * 0.3                    # Guide bonus: 30%
     )
     
-    score *= missable_multiplier   # Missable multiplier applies last
+    if is_missable is not None:
+        score *= np.where(is_missable, 3.0, 1.0)  # Missable multiplier applies last
     
-    return min(score, 1.0)  # Cap at 1.0
+    return np.minimum(score, 1.0)  # Cap at 1.0
+
+def _match_guide_titles(names_lower: Set[str], guide_map: Dict[str, str]) -> Dict[str, str]:
+    """
+    Map each achievement name to the URL of the first guide whose title contains it
+    
+    Args:
+        names_lower: Lowercased achievement names
+        guide_map: Lowercased guide title -> URL, in search result order
+        
+    Returns:
+        Dict of name -> URL for the names that appear in some title
+    """
+    matches = {}
+    if not guide_map:
+        return matches
+    if '' in names_lower:
+        matches[''] = next(iter(guide_map.values()))  # The empty string is in every title
+    
+    if ahocorasick is not None and len(names_lower) > len(matches):
+        # One automaton pass per title finds every name it contains
+        automaton = ahocorasick.Automaton()
+        for name in names_lower:
+            if name:
+                automaton.add_word(name, name)
+        automaton.make_automaton()
+        for title, url in guide_map.items():
+            for _, name in automaton.iter(title):
+                matches.setdefault(name, url)
+    else:
+        for title, url in guide_map.items():
+            for name in names_lower:
+                if name not in matches and name in title:
+                    matches[name] = url
+    return matches
 
 @mcp.tool
 def analyze_achievement_dependencies(
@@ -1992,11 +2882,7 @@ def analyze_achievement_dependencies(
         deps = dependency_graph['edges'].get(ach_name, [])
         
         # Find which level this achievement is in
-        level = None
-        for level_idx, level_achs in enumerate(dependency_graph['levels']):
-            if ach_name in level_achs:
-                level = level_idx
-                break
+        level = dependency_graph['level_index'].get(ach_name)
         
         # Check if all dependencies are met
         unmet_deps = [dep for dep in deps if dep not in unlocked_names]
@@ -2044,12 +2930,17 @@ def analyze_achievement_dependencies(
 
 @mcp.tool
 def scan_for_missable_content(
-    game_identifier: Annotated[str, "Game name or appid to scan for missable achievements"]
+    game_identifier: Annotated[str, "Game name or appid to scan for missable achievements"],
+    deep_scan: Annotated[bool, "Scan full guide text instead of only the opening section (slower)"] = False
 ) -> Dict[str, Any]:
     """Scan for time-sensitive or missable achievements that can be permanently locked"""
+    return _scan_for_missable_content(game_identifier, get_game_achievements(game_identifier), deep_scan)
+
+def _scan_for_missable_content(game_identifier: str, achievement_data: Optional[Dict[str, Any]],
+                               deep_scan: bool = False) -> Dict[str, Any]:
+    """Missable scan body for achievement data the caller already fetched with get_game_achievements"""
     
-    # Step 1: Get all achievements
-    achievement_data = get_game_achievements(game_identifier)
+    # Step 1: Check achievement data
     if not achievement_data or 'error' in achievement_data:
         return achievement_data
     
@@ -2084,76 +2975,47 @@ def scan_for_missable_content(
     except Exception:
         pass
     
-    # Step 3: Keyword patterns for missable detection
-    missable_patterns = [
-        r'\bmissable\b',
-        r'point of no return',
-        r'before (chapter|act|stage|level|mission) \d+',
-        r'limited time',
-        r'one (chance|shot|time|playthrough)',
-        r"can't (go back|return|redo|replay)",
-        r'permanently (locked|missed|unavailable)',
-        r'(story|dialogue|conversation) (choice|decision)',
-        r'must (do|complete|finish) before',
-        r'(time|event)[-\s]sensitive',
-        r'no second chance'
-    ]
+    # Step 3: Keyword patterns for missable detection (MISSABLE_PATTERNS)
     
-    # Step 4: Fetch guide content in parallel (PHASE 2.1 OPTIMIZATION)
-    # Create tasks for all guide content fetches
-    guide_tasks = []
-    for guide in missable_guides:
-        guide_id = guide.get('publishedfileid')
-        if guide_id:
-            guide_tasks.append((
-                f"guide_{guide_id}",
-                get_guide_content,
-                (guide_id,),
-                {}
-            ))
-    
-    # Execute all guide content fetches in parallel
-    guide_contents = {}
-    if guide_tasks:
-        guide_contents = executor.execute_parallel(guide_tasks)
-    
-    # Step 5: Scan guide content for missable indicators
-    missable_warnings = []
+    # Step 4-5: Fetch every guide's full text in one batched details request, then scan each
+    # (search_game_guides returns guides keyed 'id' with a truncated description; the details
+    # request is served from guide_cache for guides the search just fetched)
+    guide_ids = [(i, guide.get('id')) for i, guide in enumerate(missable_guides)]
+    guide_ids = [(i, guide_id) for i, guide_id in guide_ids if guide_id]
+    try:
+        details = _fetch_published_file_details([guide_id for _, guide_id in guide_ids])
+    except Exception:
+        details = []
     
-    for guide in missable_guides:
+    missable_warnings = []
+    for (i, _), guide_details in zip(guide_ids, details):
         try:
-            guide_id = guide.get('publishedfileid')
-            if not guide_id:
-                continue
-            
-            # Get the content from parallel results
-            task_name = f"guide_{guide_id}"
-            if task_name not in guide_contents:
-                continue
-            
-            content_result = guide_contents[task_name]
-            if not content_result or 'error' in content_result:
-                continue
-            
-            content = content_result.get('content', '').lower()
+            guide = missable_guides[i]
+            content = guide_details.get('description', '')
+            if not deep_scan:
+                content = content[:MISSABLE_SCAN_PREFIX_CHARS]
+            content = content.lower()
             title = guide.get('title', '')
             
-            # Check for patterns
+            # Check for patterns, keeping the first pattern's match for the context
             found_patterns = []
-            for pattern in missable_patterns:
-                matches = re.findall(pattern, content, re.IGNORECASE)
-                if matches:
-                    found_patterns.append(pattern)
+            first_match = None
+            for regex in MISSABLE_PATTERNS:
+                match = regex.search(content)
+                if match:
+                    found_patterns.append(regex)
+                    if first_match is None:
+                        first_match = match
             
             if found_patterns:
                 # Try to extract context around the warning
-                warning_context = _extract_warning_context(content, found_patterns[0])
+                warning_context = _extract_warning_context(content, first_match)
                 
                 missable_warnings.append({
                     'guide_title': title,
                     'guide_url': guide.get('url', ''),
                     'warning_type': 'missable_content_detected',
-                    'patterns_found': found_patterns[:3],  # Top 3 patterns
+                    'patterns_found': [regex.pattern for regex in found_patterns[:3]],  # Top 3 patterns
                     'context': warning_context
                 })
         except Exception:
@@ -2166,12 +3028,12 @@ def scan_for_missable_content(
         name = ach.get('name', '')
         
         # Check description for missable patterns
-        for pattern in missable_patterns[:5]:  # Check most critical patterns
-            if re.search(pattern, desc, re.IGNORECASE):
+        for regex in MISSABLE_PATTERNS[:5]:  # Check most critical patterns
+            if regex.search(desc):
                 achievement_warnings.append({
                     'achievement_name': name,
                     'achievement_description': ach.get('description', ''),
-                    'warning': f"Description contains potential missable indicator: '{pattern}'",
+                    'warning': f"Description contains potential missable indicator: '{regex.pattern}'",
                     'urgency': 'medium'
                 })
                 break
@@ -2194,16 +3056,14 @@ def scan_for_missable_content(
     
     return result
 
-def _extract_warning_context(content: str, pattern: str, window: int = 100) -> str:
-    """Extract text context around a warning pattern"""
+def _extract_warning_context(content: str, match: Optional[re.Match], window: int = 100) -> str:
+    """Extract text context around an already-found warning match"""
     try:
-        match = re.search(pattern, content, re.IGNORECASE)
         if match:
             start = max(0, match.start() - window)
             end = min(len(content), match.end() + window)
-            context = content[start:end].strip()
-            # Clean up
-            context = re.sub(r'\s+', ' ', context)
+            # Clean up: collapse whitespace runs to single spaces
+            context = ' '.join(content[start:end].split())
             return f"...{context}..."
     except Exception:
         pass
@@ -2236,17 +3096,28 @@ def get_current_session_context() -> Dict[str, Any]:
         'playtime_total': round(current_game.get('playtime_forever_hours', 0), 1)
     }
     
+    def achievement_context() -> Dict[str, Any]:
+        # Fetch achievements once and share them with the missable scan and roadmap
+        achievement_data = get_game_achievements(game_name)
+        derived = executor.execute_parallel([
+            ('missable', _scan_for_missable_content, (game_name, achievement_data), {}),
+            ('roadmap', _achievement_roadmap, (game_name, achievement_data), {'sort_by': 'efficiency'})
+        ])
+        derived['achievements'] = achievement_data
+        return derived
+    
     # Step 4-8: Execute all data fetching in parallel (PHASE 2.1 OPTIMIZATION)
     tasks = [
-        ('achievements', get_game_achievements, (game_name,), {}),
-        ('missable', scan_for_missable_content, (game_name,), {}),
-        ('roadmap', get_achievement_roadmap, (game_name,), {'sort_by': 'efficiency'}),
+        ('achievement_context', achievement_context, (), {}),
         ('news', get_game_news, (appid,), {'count': 3}),
         ('players', get_game_player_count, (appid,), {})
     ]
     
-    # Execute all tasks in parallel
+    # Execute all tasks in parallel; missing achievement keys fall through to the error branches below
     results = executor.execute_parallel(tasks)
+    achievement_results = results.pop('achievement_context')
+    if 'error' not in achievement_results:
+        results.update(achievement_results)
     
     # Process achievements result
     if 'achievements' in results and 'error' not in results['achievements']:
@@ -2320,11 +3191,10 @@ def get_current_session_context() -> Dict[str, Any]:
 def get_performance_stats() -> Dict[str, Any]:
     """Get comprehensive performance and cache statistics for Phase 2 optimizations"""
     
-    # Calculate estimated memory usage (rough estimate)
+    # Estimated memory usage from each cache's incrementally tracked entry sizes
     def estimate_cache_memory_mb(cache: TTLCache) -> float:
         """Estimate memory usage of cache in MB"""
-        # Rough estimate: average entry size ~500 KB
-        return round(len(cache.cache) * 0.5, 1)
+        return round(cache.bytes / 1_000_000, 1)
     
     return {
         'cache_stats': {
@@ -2343,6 +3213,10 @@ def get_performance_stats() -> Dict[str, Any]:
                 'estimated_memory_mb': estimate_cache_memory_mb(guide_cache),
                 'description': 'Guide content cache (60 min TTL)'
             },
+            'error_cache': {
+                **error_cache.stats(),
+                'description': 'Failed Steam API call cache (10 s TTL)'
+            },
             'total_estimated_memory_mb': round(
                 estimate_cache_memory_mb(api_cache) +
                 estimate_cache_memory_mb(tool_cache) +
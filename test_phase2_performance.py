@@ -4,7 +4,7 @@ Performance test for Phase 2.0 (Caching) + Phase 2.1 (Parallel Execution)
 Tests the three strategic tools to measure actual speedup
 """
 
-from time import time
+from time import perf_counter_ns
 from mcp_server import (
     api_cache, tool_cache, guide_cache, executor,
     get_game_achievements, get_achievement_roadmap,
@@ -27,17 +27,17 @@ def test_caching():
     
     # First call (cold cache)
     print(f"\nCold cache call: get_game_achievements('{game}')")
-    start = time()
+    start = perf_counter_ns()
     result1 = get_game_achievements(game)
-    cold_time = (time() - start) * 1000
+    cold_time = (perf_counter_ns() - start) / 1_000_000
     print(f"  Time: {cold_time:.0f}ms")
     print(f"  API cache stats: {api_cache.stats()}")
     
     # Second call (warm cache)
     print(f"\nWarm cache call: get_game_achievements('{game}')")
-    start = time()
+    start = perf_counter_ns()
     result2 = get_game_achievements(game)
-    warm_time = (time() - start) * 1000
+    warm_time = (perf_counter_ns() - start) / 1_000_000
     print(f"  Time: {warm_time:.0f}ms")
     print(f"  API cache stats: {api_cache.stats()}")
     
@@ -62,9 +62,9 @@ def test_parallel_roadmap():
     print(f"\nExecuting get_achievement_roadmap('{game}')...")
     print("  (Fetches: achievements + global_stats + guides in parallel)")
     
-    start = time()
+    start = perf_counter_ns()
     result = get_achievement_roadmap(game)
-    elapsed = (time() - start) * 1000
+    elapsed = (perf_counter_ns() - start) / 1_000_000
     
     print(f"\n  Total time: {elapsed:.0f}ms")
     print(f"  Executor avg: {executor.avg_time_ms():.0f}ms")
@@ -96,9 +96,9 @@ def test_parallel_missable():
     print(f"\nExecuting scan_for_missable_content('{game}')...")
     print("  (Fetches multiple guide contents in parallel)")
     
-    start = time()
+    start = perf_counter_ns()
     result = scan_for_missable_content(game)
-    elapsed = (time() - start) * 1000
+    elapsed = (perf_counter_ns() - start) / 1_000_000
     
     print(f"\n  Total time: {elapsed:.0f}ms")
     print(f"  Executor avg: {executor.avg_time_ms():.0f}ms")